@@ -0,0 +1,118 @@
+"""
+📊 Analysis Jank Benchmark
+━━━━━━━━━━━━━━━━━━━━━━━━━
+How much album art analysis delays a 60 Hz "UI" loop in this process:
+
+- idle:     no analysis running                      (baseline)
+- threads:  decode + palette on IMAGE_WORKERS threads (default backend)
+- process:  the same work on the AnalysisPool         (IMAGE_PROCESS_POOL)
+
+The UI loop does a little pure-Python work per frame, like Qt event
+handlers do, so it competes for the GIL the same way the real one does.
+Images are synthetic 640x640 JPEGs unless a directory is given.
+
+Usage: python benchmarks/bench_analysis_jank.py [corpus_dir] [images]
+"""
+
+import os
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PIL import Image, ImageDraw, ImageFilter
+
+from core.analysis_pool import AnalysisPool, decode_and_analyze
+from core.config import Config
+from core.frame_stats import FrameStats
+
+
+def load_corpus(root, limit):
+    blobs = []
+    for dirpath, _, files in os.walk(root):
+        for name in sorted(files):
+            if not name.endswith('.tmp'):
+                with open(os.path.join(dirpath, name), 'rb') as f:
+                    blobs.append(f.read())
+            if len(blobs) >= limit:
+                return blobs
+    return blobs
+
+
+def synthetic_corpus(count, size=640):
+    rng = random.Random(0)
+    blobs = []
+    for _ in range(count):
+        img = Image.new('RGB', (size, size), tuple(rng.randrange(256) for _ in range(3)))
+        draw = ImageDraw.Draw(img)
+        for _ in range(60):
+            x, y = rng.randrange(size), rng.randrange(size)
+            w, h = rng.randrange(20, size // 2), rng.randrange(20, size // 2)
+            draw.ellipse([x, y, x + w, y + h], fill=tuple(rng.randrange(256) for _ in range(3)))
+        buf = BytesIO()
+        img.filter(ImageFilter.GaussianBlur(4)).save(buf, 'JPEG', quality=90)
+        blobs.append(buf.getvalue())
+    return blobs
+
+
+def ui_loop(stats, done):
+    """60 Hz loop with ~2 ms of Python work per frame"""
+    budget = Config.FRAME_BUDGET_MS / 1000
+    stats.start()
+    next_frame = time.perf_counter()
+    while not done.is_set():
+        sum(i * i for i in range(8000))
+        stats.tick()
+        next_frame += budget
+        time.sleep(max(0.0, next_frame - time.perf_counter()))
+
+
+def run(label, work):
+    stats, done = FrameStats(), threading.Event()
+    ui = threading.Thread(target=ui_loop, args=(stats, done))
+    ui.start()
+    start = time.perf_counter()
+    work()
+    elapsed = time.perf_counter() - start
+    done.set()
+    ui.join()
+    s = stats.summary()
+    print(f"{label:<10}{elapsed * 1000:>10.0f}{s['mean_ms']:>9.1f}{s['p95_ms']:>9.1f}"
+          f"{s['max_ms']:>9.1f}{s['janky']:>8}/{s['frames']}")
+
+
+def main():
+    root = sys.argv[1] if len(sys.argv) > 1 else None
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 24
+    blobs = load_corpus(root, count) if root and os.path.isdir(root) else synthetic_corpus(count)
+
+    pool = AnalysisPool()
+    pool.warm().result()
+
+    def idle():
+        time.sleep(1.0)
+
+    def threads():
+        with ThreadPoolExecutor(Config.IMAGE_WORKERS) as ex:
+            list(ex.map(lambda b: decode_and_analyze(b)[0].tobytes(), blobs))
+
+    def process():
+        with ThreadPoolExecutor(Config.IMAGE_WORKERS) as ex:
+            list(ex.map(lambda b: pool.analyze(b, True, lambda px, w, h: bytes(px)), blobs))
+
+    print(f"{len(blobs)} images, {Config.IMAGE_WORKERS} threads, "
+          f"{Config.IMAGE_PROCESSES} process(es)\n")
+    print(f"{'backend':<10}{'total ms':>10}{'mean':>9}{'p95':>9}{'max':>9}{'janky':>13}")
+    print("-" * 60)
+    run("idle", idle)
+    run("threads", threads)
+    run("process", process)
+    pool.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+📊 Color Extraction Benchmark
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+Time and accuracy of the NumPy extractor against ColorThief (quality=1)
+on a corpus of album art:
+
+- colorthief:  ColorThief.get_color(quality=1)      (what we used to run)
+- full:        core.color_extract, every pixel       (should match exactly)
+- sampled:     core.color_extract, COLOR_SAMPLE_SIZE (what the pipeline runs)
+
+The corpus is every file in the given directory (default: the on-disk art
+cache). Without one, synthetic images are generated.
+
+Usage: python benchmarks/bench_color_extract.py [corpus_dir] [limit]
+"""
+
+import math
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PIL import Image, ImageDraw, ImageFilter
+
+from core.color_extract import dominant_rgb
+from core.config import BASE_DIR, ColorThief, Config
+
+
+def load_corpus(root, limit):
+    images = []
+    for dirpath, _, files in os.walk(root):
+        for name in sorted(files):
+            if name.endswith('.tmp'):
+                continue
+            try:
+                with Image.open(os.path.join(dirpath, name)) as img:
+                    images.append(img.convert('RGB'))
+            except OSError:
+                continue
+            if len(images) >= limit:
+                return images
+    return images
+
+
+def synthetic_corpus(count, size=640):
+    rng = random.Random(0)
+    images = []
+    for _ in range(count):
+        img = Image.new('RGB', (size, size), tuple(rng.randrange(256) for _ in range(3)))
+        draw = ImageDraw.Draw(img)
+        for _ in range(60):
+            x, y = rng.randrange(size), rng.randrange(size)
+            w, h = rng.randrange(20, size // 2), rng.randrange(20, size // 2)
+            draw.ellipse([x, y, x + w, y + h], fill=tuple(rng.randrange(256) for _ in range(3)))
+        images.append(img.filter(ImageFilter.GaussianBlur(4)))
+    return images
+
+
+def colorthief_rgb(image):
+    thief = ColorThief.__new__(ColorThief)
+    thief.image = image
+    return thief.get_color(quality=1)
+
+
+def run(fn, images):
+    start = time.perf_counter()
+    colors = [fn(img) for img in images]
+    return colors, (time.perf_counter() - start) / len(images) * 1000
+
+
+def distance(a, b):
+    return math.dist(a, b)
+
+
+def main():
+    root = sys.argv[1] if len(sys.argv) > 1 else os.path.join(BASE_DIR, Config.ART_CACHE_DIR)
+    limit = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    images = load_corpus(root, limit) if os.path.isdir(root) else []
+    if not images:
+        print(f"No images under {root}, using synthetic 640x640 art")
+        images = synthetic_corpus(min(limit, 20))
+    print(f"{len(images)} images, sample size {Config.COLOR_SAMPLE_SIZE}\n")
+
+    reference, ref_ms = run(colorthief_rgb, images)
+    rows = [
+        ("colorthief", reference, ref_ms),
+        ("full", *run(lambda img: dominant_rgb(img, max_side=0), images)),
+        ("sampled", *run(dominant_rgb, images)),
+    ]
+
+    print(f"{'extractor':<12}{'ms/img':>10}{'speedup':>10}{'exact':>8}{'mean Δ':>9}{'max Δ':>9}")
+    print("-" * 58)
+    for name, colors, ms in rows:
+        deltas = [distance(a, b) for a, b in zip(colors, reference)]
+        exact = sum(d == 0 for d in deltas)
+        print(f"{name:<12}{ms:>10.1f}{ref_ms / ms:>9.0f}x{exact:>8}"
+              f"{sum(deltas) / len(deltas):>9.2f}{max(deltas):>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+📊 Playback Payload Benchmark
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+Bytes on the wire and parse time for the player endpoints the worker uses:
+
+- full:    GET /me/player                          (what we used to poll)
+- market:  GET /me/player?market=from_token        (no available_markets)
+- lean:    GET /me/player/currently-playing?market=from_token
+
+Payloads are synthetic but shaped like real responses (185 markets).
+
+Usage: python benchmarks/bench_playback_payload.py [iterations]
+"""
+
+import gzip
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.playback_state import PlaybackState, TrackInfo
+
+MARKETS = [f"{chr(65 + i // 26)}{chr(65 + i % 26)}" for i in range(185)]
+
+
+def _artist(i):
+    return {
+        "external_urls": {"spotify": f"https://open.spotify.com/artist/artist{i}"},
+        "href": f"https://api.spotify.com/v1/artists/artist{i}",
+        "id": f"artist{i}", "name": f"Artist {i}", "type": "artist",
+        "uri": f"spotify:artist:artist{i}",
+    }
+
+
+def make_item(with_markets):
+    album = {
+        "album_type": "album", "total_tracks": 12,
+        "external_urls": {"spotify": "https://open.spotify.com/album/album0"},
+        "href": "https://api.spotify.com/v1/albums/album0",
+        "id": "album0", "name": "Some Album", "release_date": "2021-03-05",
+        "release_date_precision": "day", "type": "album", "uri": "spotify:album:album0",
+        "artists": [_artist(0)],
+        "images": [
+            {"url": f"https://i.scdn.co/image/ab67616d0000{size:04d}", "width": size, "height": size}
+            for size in (640, 300, 64)
+        ],
+    }
+    item = {
+        "album": album, "artists": [_artist(0), _artist(1)],
+        "disc_number": 1, "duration_ms": 215000, "explicit": False,
+        "external_ids": {"isrc": "USXXX2100001"},
+        "external_urls": {"spotify": "https://open.spotify.com/track/track0"},
+        "href": "https://api.spotify.com/v1/tracks/track0",
+        "id": "track0", "is_local": False, "name": "Some Track", "popularity": 61,
+        "preview_url": None, "track_number": 3, "type": "track", "uri": "spotify:track:track0",
+    }
+    if with_markets:
+        album["available_markets"] = MARKETS
+        item["available_markets"] = MARKETS
+    else:
+        item["is_playable"] = True
+    return item
+
+
+def make_payload(kind):
+    data = {
+        "timestamp": 1700000000000, "progress_ms": 73000, "is_playing": True,
+        "currently_playing_type": "track",
+        "context": {"type": "album", "uri": "spotify:album:album0",
+                    "href": "https://api.spotify.com/v1/albums/album0",
+                    "external_urls": {"spotify": "https://open.spotify.com/album/album0"}},
+        "actions": {"disallows": {"resuming": True}},
+        "item": make_item(with_markets=(kind == "full")),
+    }
+    if kind != "lean":
+        data.update({
+            "device": {"id": "dev0", "is_active": True, "is_private_session": False,
+                       "is_restricted": False, "name": "DESKTOP", "type": "Computer",
+                       "volume_percent": 64, "supports_volume": True},
+            "shuffle_state": False, "smart_shuffle": False, "repeat_state": "off",
+        })
+    return json.dumps(data).encode()
+
+
+def old_parse(raw):
+    """What the UI used to read from the full dict on every tick"""
+    data = json.loads(raw)
+    item = data["item"]
+    return (item["id"], data["is_playing"], data["shuffle_state"], data["repeat_state"],
+            data["device"]["volume_percent"], data["progress_ms"], item["duration_ms"],
+            item["name"], item["artists"][0]["name"], item["album"]["images"][-1]["url"])
+
+
+def lean_parse(raw, previous=None):
+    data = json.loads(raw)
+    state = PlaybackState.from_response(data, previous)
+    TrackInfo.from_item(data["item"])
+    return state
+
+
+def bench(fn, *args, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn(*args)
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    payloads = {kind: make_payload(kind) for kind in ("full", "market", "lean")}
+    previous = PlaybackState.from_response(json.loads(payloads["market"]))
+
+    print(f"{'endpoint':<10}{'bytes':>10}{'gzip':>10}{'parse µs':>12}")
+    print("-" * 42)
+    rows = [
+        ("full", old_parse, ()),
+        ("market", lean_parse, ()),
+        ("lean", lean_parse, (previous,)),
+    ]
+    for kind, fn, extra in rows:
+        raw = payloads[kind]
+        us = bench(fn, raw, *extra, iterations=iterations)
+        print(f"{kind:<10}{len(raw):>10}{len(gzip.compress(raw)):>10}{us:>12.1f}")
+
+    full, lean = len(payloads["full"]), len(payloads["lean"])
+    print(f"\nlean payload is {lean / full:.0%} of the full one")
+
+
+if __name__ == "__main__":
+    main()
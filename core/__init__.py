@@ -2,17 +2,48 @@
 🎵 Dynamic Island Core Package
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 Modular components for Dynamic Island Spotify Controller
+
+Exports are imported on first use, so submodules that don't need Qt
+(e.g. in analysis pool workers) can be imported without loading it.
 """
 
-from .config import Colors, Config, BASE_DIR, CLIENT_ID, CLIENT_SECRET, REDIRECT_URI, SCOPE
-from .spotify_worker import SpotifyWorker
-from .widgets import RoundedPanel, StyledButton, StyledSlider
-from .settings import SettingsDialog
-
-__all__ = [
-    'Colors', 'Config', 'BASE_DIR',
-    'CLIENT_ID', 'CLIENT_SECRET', 'REDIRECT_URI', 'SCOPE',
-    'SpotifyWorker',
-    'RoundedPanel', 'StyledButton', 'StyledSlider',
-    'SettingsDialog'
-]
+import importlib
+
+_EXPORTS = {
+    '.config': ('Colors', 'Config', 'BASE_DIR', 'CLIENT_ID', 'CLIENT_SECRET', 'REDIRECT_URI', 'SCOPE'),
+    '.art_cache': ('DiskImageCache', 'get_art_cache'),
+    '.color_index': ('ColorIndex', 'get_color_index'),
+    '.color_extract': ('dominant_color', 'quantize'),
+    '.palette': ('assign_roles', 'contrast_ratio', 'extract_palette'),
+    '.lru_cache': ('LRUCache',),
+    '.liked_cache': ('LikedCache',),
+    '.analysis_pool': ('AnalysisPool', 'get_analysis_pool'),
+    '.frame_stats': ('FrameStats',),
+    '.frame_dispatcher': ('FrameDispatcher',),
+    '.command_executor': ('CommandExecutor',),
+    '.governor': ('RequestGovernor', 'RequestRejected'),
+    '.http_session': ('get_session', 'session_stats'),
+    '.image_pipeline': ('ImagePipeline', 'ImageResult', 'get_image_pipeline'),
+    '.playback_clock': ('PlaybackClock',),
+    '.playback_state': ('PlaybackState', 'TrackInfo'),
+    '.spotify_worker': ('SpotifyWorker',),
+    '.token_manager': ('TokenManager',),
+    '.widgets': ('RoundedPanel', 'StyledButton', 'StyledSlider'),
+    '.settings': ('SettingsDialog',),
+}
+_MODULES = {name: module for module, names in _EXPORTS.items() for name in names}
+
+__all__ = list(_MODULES)
+
+
+def __getattr__(name):
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
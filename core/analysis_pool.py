@@ -0,0 +1,179 @@
+"""
+🧮 Analysis Pool Module
+━━━━━━━━━━━━━━━━━━━━━━
+Optional worker processes for album art decode and palette analysis
+"""
+
+import atexit
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from io import BytesIO
+
+from .config import Config
+from .palette import extract_palette
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:
+    shared_memory = None
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+_pool = None
+_lock = threading.Lock()
+
+MAX_RESTARTS = 3    # Crashed pools rebuilt before staying in-thread
+
+
+def decode_and_analyze(data, want_palette=True):
+    """(RGB PIL image, palette or None) for encoded image bytes"""
+    decoded = Image.open(BytesIO(data)).convert('RGB')
+    palette = None
+    if want_palette:
+        try:
+            palette = extract_palette(decoded)
+        except Exception as e:
+            print(f"Color extraction error: {e}")
+    return decoded, palette
+
+
+def _analyze_shared(name, size, want_palette):
+    """Pool worker: encoded bytes in block `name` -> RGB pixels in a new block.
+
+    PIL needs a file object, so the encoded bytes are copied once into a
+    BytesIO; the decoded pixels are copied once into the output block.
+    """
+    src = shared_memory.SharedMemory(name=name)
+    try:
+        with src.buf[:size] as view:
+            decoded, palette = decode_and_analyze(view, want_palette)
+    finally:
+        src.close()
+
+    raw = decoded.tobytes()
+    out = shared_memory.SharedMemory(create=True, size=max(1, len(raw)))
+    out.buf[:len(raw)] = raw
+    out.close()       # The parent unlinks it once the pixels are consumed
+    w, h = decoded.size
+    return out.name, w, h, len(raw), palette
+
+
+def _ready():
+    return True
+
+
+class AnalysisPool:
+    """Small persistent process pool for the CPU-heavy part of the image pipeline.
+
+    Decoding and palette extraction run in other interpreters, so they
+    never hold the GUI process's GIL. Encoded bytes go in and decoded
+    RGB pixels come back through shared memory blocks, so nothing large
+    is pickled (only block names and the palette). This is not zero-copy:
+    each side still copies into and out of the blocks.
+
+    If a worker dies (crash, OOM kill) the pool is rebuilt and the job
+    runs in the calling thread; after MAX_RESTARTS the pool stays off.
+    Jobs arriving while the pool is shut down also run in-thread.
+    """
+
+    def __init__(self, workers=None):
+        self._workers = workers or Config.IMAGE_PROCESSES
+        self._executor = self._create_executor()
+        self._lock = threading.Lock()
+        self._stats = {'jobs': 0, 'bytes_in': 0, 'bytes_out': 0, 'restarts': 0, 'in_thread': 0}
+        atexit.register(self.shutdown)
+
+    def _create_executor(self):
+        return ProcessPoolExecutor(
+            max_workers=self._workers, mp_context=multiprocessing.get_context('spawn'))
+
+    def warm(self):
+        """Start the workers now instead of on the first track change"""
+        return self._executor.submit(_ready)
+
+    def _broken(self, executor):
+        """Replace (or retire) a pool that lost a worker"""
+        with self._lock:
+            if self._executor is not executor:
+                return      # Another job already handled it
+            executor.shutdown(wait=False, cancel_futures=True)
+            if self._stats['restarts'] < MAX_RESTARTS:
+                self._stats['restarts'] += 1
+                self._executor = self._create_executor()
+            else:
+                self._executor = None
+                print("Analysis pool keeps crashing - analyzing in-thread from now on")
+
+    def analyze(self, data, want_palette, build):
+        """(build(pixels, w, h), palette) for encoded image bytes.
+
+        `build` receives a view of the RGB888 pixels that is only valid
+        during the call - copy whatever needs to outlive it.
+        """
+        executor = self._executor
+        if executor is None:
+            return self._analyze_here(data, want_palette, build)
+
+        src = shared_memory.SharedMemory(create=True, size=len(data))
+        try:
+            src.buf[:len(data)] = data
+            try:
+                future = executor.submit(_analyze_shared, src.name, len(data), want_palette)
+            except BrokenProcessPool:
+                raise
+            except RuntimeError:
+                # Executor is shutting down
+                return self._analyze_here(data, want_palette, build)
+            name, w, h, size, palette = future.result()
+        except BrokenProcessPool:
+            self._broken(executor)
+            return self._analyze_here(data, want_palette, build)
+        finally:
+            src.close()
+            src.unlink()
+
+        out = shared_memory.SharedMemory(name=name)
+        try:
+            with out.buf[:size] as pixels:
+                result = build(pixels, w, h)
+        finally:
+            out.close()
+            out.unlink()
+
+        with self._lock:
+            self._stats['jobs'] += 1
+            self._stats['bytes_in'] += len(data)
+            self._stats['bytes_out'] += size
+        return result, palette
+
+    def _analyze_here(self, data, want_palette, build):
+        decoded, palette = decode_and_analyze(data, want_palette)
+        with self._lock:
+            self._stats['in_thread'] += 1
+        return build(decoded.tobytes(), *decoded.size), palette
+
+    def stats(self):
+        with self._lock:
+            return dict(self._stats)
+
+    def shutdown(self):
+        executor = self._executor
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+def get_analysis_pool():
+    """The process-wide analysis pool, or None when disabled or unsupported"""
+    global _pool
+    if not Config.IMAGE_PROCESS_POOL or shared_memory is None or Image is None:
+        return None
+    if _pool is None:
+        with _lock:
+            if _pool is None:
+                _pool = AnalysisPool()
+    return _pool
@@ -0,0 +1,158 @@
+"""
+💾 Album Art Cache Module
+━━━━━━━━━━━━━━━━━━━━━━━━
+Persistent on-disk image cache with a byte budget and LRU eviction
+"""
+
+import hashlib
+import mmap
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+
+from .config import BASE_DIR, Config
+
+_cache = None
+_lock = threading.Lock()
+
+
+def cache_key(url):
+    """Content address for an image URL"""
+    return hashlib.sha1(url.encode('utf-8')).hexdigest()
+
+
+class DiskImageCache:
+    """Album art bytes stored under BASE_DIR, survives restarts.
+
+    Files live at `<root>/<key[:2]>/<key>`. Recency is kept in memory and
+    persisted through file mtimes, so the LRU order is rebuilt on start.
+    Writes go to a temp file first and are renamed into place.
+    """
+
+    def __init__(self, root=None, max_bytes=None):
+        self.root = root or os.path.join(BASE_DIR, Config.ART_CACHE_DIR)
+        self.max_bytes = Config.ART_CACHE_BYTES if max_bytes is None else max_bytes
+        self._lock = threading.Lock()
+        self._entries = None         # key -> size, least recently used first
+        self._bytes = 0
+        self._stats = {'hits': 0, 'misses': 0, 'writes': 0, 'evictions': 0}
+
+    def _path(self, key):
+        return os.path.join(self.root, key[:2], key)
+
+    def _load_index(self):
+        """Scan the cache directory once (lock held)"""
+        if self._entries is not None:
+            return
+        found = []
+        if os.path.isdir(self.root):
+            for sub in os.scandir(self.root):
+                if not sub.is_dir():
+                    continue
+                for entry in os.scandir(sub.path):
+                    if entry.name.endswith('.tmp'):
+                        continue
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    found.append((st.st_mtime, entry.name, st.st_size))
+        found.sort()
+        self._entries = OrderedDict((name, size) for _, name, size in found)
+        self._bytes = sum(self._entries.values())
+        self._evict()
+
+    def get(self, url):
+        """Return cached bytes for `url`, or None"""
+        key = cache_key(url)
+        with self._lock:
+            self._load_index()
+            if key not in self._entries:
+                self._stats['misses'] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats['hits'] += 1
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    data = mm[:]
+            os.utime(path)
+            return data
+        except (OSError, ValueError):
+            # Removed behind our back (or empty) - forget it
+            with self._lock:
+                size = self._entries.pop(key, None)
+                if size is not None:
+                    self._bytes -= size
+                self._stats['hits'] -= 1
+                self._stats['misses'] += 1
+            return None
+
+    def put(self, url, data):
+        if not data or len(data) > self.max_bytes:
+            return
+        key = cache_key(url)
+        path = self._path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        except OSError as e:
+            print(f"Art cache write error: {e}")
+            return
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException as e:
+            # Don't leave the partial temp file behind
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            if not isinstance(e, OSError):
+                raise
+            print(f"Art cache write error: {e}")
+            return
+        with self._lock:
+            self._load_index()
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old
+            self._entries[key] = len(data)
+            self._bytes += len(data)
+            self._stats['writes'] += 1
+            self._evict()
+
+    def __contains__(self, url):
+        with self._lock:
+            self._load_index()
+            return cache_key(url) in self._entries
+
+    def _evict(self):
+        while self._bytes > self.max_bytes and self._entries:
+            key, size = self._entries.popitem(last=False)
+            self._bytes -= size
+            self._stats['evictions'] += 1
+            try:
+                os.remove(self._path(key))
+            except OSError:
+                pass
+
+    def stats(self):
+        with self._lock:
+            s = dict(self._stats)
+            s['entries'] = len(self._entries or ())
+            s['bytes'] = self._bytes
+        return s
+
+
+def get_art_cache():
+    """The process-wide album art cache"""
+    global _cache
+    if _cache is None:
+        with _lock:
+            if _cache is None:
+                _cache = DiskImageCache()
+    return _cache
@@ -0,0 +1,218 @@
+"""
+🎨 Color Extraction Module
+━━━━━━━━━━━━━━━━━━━━━━━━━
+Vectorized dominant-color extraction for album art
+"""
+
+from .config import ColorThief, Config
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+SIGBITS = 5
+RSHIFT = 8 - SIGBITS
+MAX_ITERATION = 1000
+FRACT_BY_POPULATIONS = 0.75
+
+
+def boost_dark_color(r, g, b):
+    """Lift colors that would vanish against the dark island background"""
+    brightness = (r + g + b) / 3
+    if brightness < 60:
+        # Brighten the color
+        factor = 1.5
+        r = min(255, int(r * factor))
+        g = min(255, int(g * factor))
+        b = min(255, int(b * factor))
+
+        # If still too dark, use a lighter version of the color
+        if (r + g + b) / 3 < 60:
+            r, g, b = [min(255, c + 60) for c in (r, g, b)]
+    return r, g, b
+
+
+def to_hex(rgb):
+    r, g, b = rgb
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+
+def sample_pixels(image, max_side=None):
+    """(N, 3) uint8 array of the pixels ColorThief would consider.
+
+    Subsamples (no blending) down to about `max_side` pixels per side,
+    drops transparent and near-white pixels.
+    """
+    max_side = Config.COLOR_SAMPLE_SIZE if max_side is None else max_side
+    has_alpha = image.mode in ('RGBA', 'LA', 'P')
+    arr = np.asarray(image.convert('RGBA' if has_alpha else 'RGB'))
+    if max_side:
+        step = max(1, -(-max(arr.shape[:2]) // max_side))
+        arr = arr[::step, ::step]
+    arr = arr.reshape(-1, arr.shape[-1])
+    keep = ~((arr[:, 0] > 250) & (arr[:, 1] > 250) & (arr[:, 2] > 250))
+    if has_alpha:
+        keep &= arr[:, 3] >= 125
+    return arr[keep, :3]
+
+
+# ──────────────────────────────────────────────────────────────
+# MODIFIED MEDIAN CUT over a 5-bit histogram
+# Same algorithm (and tie-breaking) as ColorThief's MMCQ, but the
+# histogram and every box statistic are NumPy reductions.
+# ──────────────────────────────────────────────────────────────
+
+class _Box:
+    __slots__ = ('lo', 'hi', 'idx', 'count')
+
+    def __init__(self, lo, hi, idx, counts):
+        self.lo = lo
+        self.hi = hi
+        self.idx = idx              # Indices of histogram colors inside the box
+        self.count = int(counts[idx].sum())
+
+    @property
+    def volume(self):
+        return int(np.prod(self.hi - self.lo + 1))
+
+
+class _PQueue:
+    """ColorThief's lazily sorted queue - kept for identical tie-breaking"""
+
+    def __init__(self, key):
+        self.key = key
+        self.contents = []
+        self._sorted = False
+
+    def push(self, item):
+        self.contents.append(item)
+        self._sorted = False
+
+    def pop(self):
+        if not self._sorted:
+            self.contents.sort(key=self.key)
+            self._sorted = True
+        return self.contents.pop()
+
+    def __len__(self):
+        return len(self.contents)
+
+
+def _histogram(pixels):
+    q = pixels.astype(np.int32) >> RSHIFT
+    index = (q[:, 0] << (2 * SIGBITS)) | (q[:, 1] << SIGBITS) | q[:, 2]
+    hist = np.bincount(index, minlength=1 << (3 * SIGBITS))
+    present = np.nonzero(hist)[0]
+    coords = np.stack([
+        present >> (2 * SIGBITS),
+        (present >> SIGBITS) & ((1 << SIGBITS) - 1),
+        present & ((1 << SIGBITS) - 1),
+    ], axis=1)
+    return coords, hist[present]
+
+
+def _median_cut(box, coords, counts):
+    if not box.count:
+        return None, None
+    if box.count == 1:
+        return box, None
+    widths = box.hi - box.lo + 1
+    axis = int(np.argmax(widths))       # First of r, g, b on ties
+    lo, hi = int(box.lo[axis]), int(box.hi[axis])
+
+    values = coords[box.idx, axis]
+    partial = np.cumsum(np.bincount(values - lo, weights=counts[box.idx],
+                                    minlength=hi - lo + 1))
+    total = partial[-1]
+    above = np.nonzero(partial > total / 2)[0]
+    if not len(above):
+        return None, None
+    i = lo + int(above[0])
+    left, right = i - lo, hi - i
+    if left <= right:
+        d2 = min(hi - 1, int(i + right / 2))
+    else:
+        d2 = max(lo, int(i - 1 - left / 2))
+    # Avoid 0-count boxes
+    while d2 < lo or (d2 - lo < len(partial) and not partial[d2 - lo]):
+        d2 += 1
+    while total - partial[d2 - lo] == 0 and d2 - 1 >= lo and partial[d2 - 1 - lo]:
+        d2 -= 1
+
+    in_first = values <= d2
+    hi1 = box.hi.copy()
+    hi1[axis] = d2
+    lo2 = box.lo.copy()
+    lo2[axis] = d2 + 1
+    return (_Box(box.lo.copy(), hi1, box.idx[in_first], counts),
+            _Box(lo2, box.hi.copy(), box.idx[~in_first], counts))
+
+
+def _iterate(queue, target, coords, counts):
+    n_color, n_iter = 1, 0
+    while n_iter < MAX_ITERATION:
+        box = queue.pop()
+        if not box.count:
+            queue.push(box)
+            n_iter += 1
+            continue
+        box1, box2 = _median_cut(box, coords, counts)
+        if box1 is None:
+            return
+        queue.push(box1)
+        if box2 is not None:
+            queue.push(box2)
+            n_color += 1
+        if n_color >= target:
+            return
+        n_iter += 1
+
+
+def _box_average(box, coords, counts):
+    mult = 1 << RSHIFT
+    weights = counts[box.idx]
+    total = int(weights.sum())
+    if total:
+        avg = (weights[:, None] * (coords[box.idx] + 0.5) * mult).sum(axis=0) / total
+        return tuple(int(c) for c in avg)
+    return tuple(int(mult * (l + h + 1) / 2) for l, h in zip(box.lo, box.hi))
+
+
+def quantize(pixels, max_colors=5):
+    """Palette of up to `max_colors` RGB tuples, most significant first"""
+    if not len(pixels):
+        raise ValueError("No usable pixels")
+    coords, counts = _histogram(pixels)
+    root = _Box(coords.min(axis=0), coords.max(axis=0), np.arange(len(coords)), counts)
+
+    # First split by population, then by population x volume
+    queue = _PQueue(lambda b: b.count)
+    queue.push(root)
+    _iterate(queue, FRACT_BY_POPULATIONS * max_colors, coords, counts)
+    queue2 = _PQueue(lambda b: b.count * b.volume)
+    while len(queue):
+        queue2.push(queue.pop())
+    _iterate(queue2, max_colors - len(queue2), coords, counts)
+
+    palette = []
+    while len(queue2):
+        palette.append(_box_average(queue2.pop(), coords, counts))
+    return palette
+
+
+def dominant_rgb(image, max_side=None):
+    """Dominant (r, g, b) of a decoded PIL image, before any brightness boost"""
+    if np is None:
+        # Pure-Python fallback
+        thief = ColorThief.__new__(ColorThief)
+        thief.image = image
+        return thief.get_color(quality=1)
+    return quantize(sample_pixels(image, max_side), 5)[0]
+
+
+def dominant_color(image, max_side=None):
+    """Accent hex for a decoded PIL image, or None if no extractor is available"""
+    if np is None and ColorThief is None:
+        return None
+    return to_hex(boost_dark_color(*dominant_rgb(image, max_side)))
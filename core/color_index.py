@@ -0,0 +1,133 @@
+"""
+🗂️ Color Index Module
+━━━━━━━━━━━━━━━━━━━━
+Persistent album -> accent/palette index so extraction runs once per album
+"""
+
+import atexit
+import json
+import os
+import sqlite3
+import threading
+
+from .config import BASE_DIR, Config
+
+_index = None
+_lock = threading.Lock()
+
+
+class ColorIndex:
+    """SQLite-backed accent/palette store with an in-memory hash in front.
+
+    The whole table is read into a dict on first use (a few KB even for
+    thousands of albums), so lookups are O(1) and never touch disk.
+    New entries are buffered and written in one transaction every
+    COLOR_INDEX_FLUSH_S seconds and at exit.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or os.path.join(BASE_DIR, Config.COLOR_INDEX_FILE)
+        self._lock = threading.Lock()
+        self._entries = None         # key -> (accent, palette)
+        self._pending = {}
+        self._flush_timer = None
+        self._stats = {'hits': 0, 'misses': 0, 'writes': 0, 'flushes': 0}
+        atexit.register(self.flush)
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=5)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS colors ("
+            " key TEXT PRIMARY KEY, accent TEXT NOT NULL, palette TEXT)"
+        )
+        return conn
+
+    def load(self):
+        """Read the index into memory (no-op after the first call)"""
+        with self._lock:
+            if self._entries is not None:
+                return
+            entries = {}
+            try:
+                conn = self._connect()
+                try:
+                    for key, accent, palette in conn.execute(
+                            "SELECT key, accent, palette FROM colors"):
+                        entries[key] = (accent, json.loads(palette) if palette else None)
+                finally:
+                    conn.close()
+            except (sqlite3.Error, ValueError) as e:
+                print(f"Color index load error: {e}")
+            self._entries = entries
+
+    def get(self, key):
+        """Accent hex for `key`, or None"""
+        entry = self.get_entry(key)
+        return entry[0] if entry else None
+
+    def get_palette(self, key):
+        entry = self.get_entry(key)
+        return entry[1] if entry else None
+
+    def get_entry(self, key):
+        if not key:
+            return None
+        self.load()
+        entry = self._entries.get(key)
+        self._stats['hits' if entry else 'misses'] += 1
+        return entry
+
+    def put(self, key, accent, palette=None):
+        if not key:
+            return
+        self.load()
+        with self._lock:
+            if self._entries.get(key) == (accent, palette):
+                return
+            self._entries[key] = (accent, palette)
+            self._pending[key] = (accent, palette)
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(Config.COLOR_INDEX_FLUSH_S, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def flush(self):
+        """Write buffered entries in a single transaction"""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+        if not pending:
+            return
+        try:
+            conn = self._connect()
+            try:
+                with conn:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO colors (key, accent, palette) VALUES (?, ?, ?)",
+                        [(k, a, json.dumps(p) if p is not None else None)
+                         for k, (a, p) in pending.items()],
+                    )
+            finally:
+                conn.close()
+            self._stats['writes'] += len(pending)
+            self._stats['flushes'] += 1
+        except sqlite3.Error as e:
+            print(f"Color index write error: {e}")
+
+    def stats(self):
+        s = dict(self._stats)
+        s['entries'] = len(self._entries or ())
+        s['pending'] = len(self._pending)
+        return s
+
+
+def get_color_index():
+    """The process-wide color index"""
+    global _index
+    if _index is None:
+        with _lock:
+            if _index is None:
+                _index = ColorIndex()
+    return _index
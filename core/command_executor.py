@@ -0,0 +1,143 @@
+"""
+🕹️ Command Executor Module
+━━━━━━━━━━━━━━━━━━━━━━━━━
+Single ordered queue for player commands with coalescing
+"""
+
+import threading
+import time
+from collections import deque
+
+
+class _Command:
+    __slots__ = ('kind', 'args', 'callback', 'errback', 'queued_at')
+
+    def __init__(self, kind, args, callback, errback):
+        self.kind = kind
+        self.args = args
+        self.callback = callback
+        self.errback = errback
+        self.queued_at = time.monotonic()
+
+
+class CommandExecutor:
+    """Ordered, bounded executor for player commands.
+
+    Commands run in submission order on a fixed set of worker threads.
+    A command is merged into the one waiting at the tail of the queue
+    when possible: seek/volume/shuffle/repeat keep only the latest value,
+    and skips add up (three "next" clicks become one skip-by-3).
+    """
+
+    LATEST_WINS = ('seek', 'volume', 'shuffle', 'repeat')
+    ADDITIVE = ('skip',)
+
+    def __init__(self, handlers, workers=1, on_done=None, name="commands"):
+        self._handlers = handlers
+        self._on_done = on_done
+        self._queue = deque()
+        self._cond = threading.Condition()
+        self._running = True
+        self._stats = {}
+        self._threads = [
+            threading.Thread(target=self._run, name=f"{name}-{i}", daemon=True)
+            for i in range(max(1, workers))
+        ]
+        for t in self._threads:
+            t.start()
+
+    def submit(self, kind, *args, callback=None, errback=None):
+        """Queue a command.
+
+        `callback(result)` or `errback(error)` runs on the executor thread
+        once the command finishes.
+        """
+        if kind not in self._handlers:
+            raise KeyError(f"Unknown command: {kind}")
+        with self._cond:
+            tail = self._queue[-1] if self._queue else None
+            if tail is not None and tail.kind == kind:
+                if kind in self.ADDITIVE:
+                    tail.args = (tail.args[0] + args[0],) + tail.args[1:]
+                    self._stat(kind)['coalesced'] += 1
+                    if tail.args[0] == 0:
+                        self._queue.pop()
+                    return
+                if kind in self.LATEST_WINS:
+                    tail.args = args
+                    tail.callback = callback or tail.callback
+                    tail.errback = errback or tail.errback
+                    self._stat(kind)['coalesced'] += 1
+                    return
+            self._queue.append(_Command(kind, args, callback, errback))
+            self._cond.notify()
+
+    def pending(self):
+        with self._cond:
+            return len(self._queue)
+
+    def stop(self):
+        with self._cond:
+            self._running = False
+            self._queue.clear()
+            self._cond.notify_all()
+
+    def stats(self):
+        """Per-command counters and latencies in milliseconds"""
+        with self._cond:
+            out = {}
+            for kind, s in self._stats.items():
+                done = s['count'] or 1
+                out[kind] = {
+                    'count': s['count'],
+                    'errors': s['errors'],
+                    'coalesced': s['coalesced'],
+                    'avg_ms': round(s['total_ms'] / done, 1),
+                    'max_ms': round(s['max_ms'], 1),
+                    'avg_wait_ms': round(s['wait_ms'] / done, 1),
+                }
+            return out
+
+    def _stat(self, kind):
+        s = self._stats.get(kind)
+        if s is None:
+            s = self._stats[kind] = {
+                'count': 0, 'errors': 0, 'coalesced': 0,
+                'total_ms': 0.0, 'max_ms': 0.0, 'wait_ms': 0.0,
+            }
+        return s
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while self._running and not self._queue:
+                    self._cond.wait()
+                if not self._running:
+                    return
+                cmd = self._queue.popleft()
+
+            started = time.monotonic()
+            result, error = None, None
+            try:
+                result = self._handlers[cmd.kind](*cmd.args)
+            except Exception as e:
+                error = e
+            elapsed_ms = (time.monotonic() - started) * 1000
+
+            with self._cond:
+                s = self._stat(cmd.kind)
+                s['count'] += 1
+                s['total_ms'] += elapsed_ms
+                s['max_ms'] = max(s['max_ms'], elapsed_ms)
+                s['wait_ms'] += (started - cmd.queued_at) * 1000
+                if error is not None:
+                    s['errors'] += 1
+
+            handler, value = (cmd.callback, result) if error is None else (cmd.errback, error)
+            if handler:
+                try:
+                    handler(value)
+                except Exception as e:
+                    print(f"Command callback error ({cmd.kind}): {e}")
+            if self._on_done:
+                self._on_done(cmd.kind, error)
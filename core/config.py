@@ -28,11 +28,9 @@ try:
 except ImportError:
     ColorThief = None
 
-try:
-    os.environ["QT_API"] = "pyside6"
-    import qtawesome as qta
-except ImportError:
-    qta = None
+# qtawesome is imported where icons are drawn (core.widgets); importing it
+# here would load Qt into every process that reads the config
+os.environ["QT_API"] = "pyside6"
 
 
 class Colors:
@@ -51,9 +49,63 @@ class Config:
     COLLAPSED_W, COLLAPSED_H = 200, 52
     EXPANDED_W, EXPANDED_H = 480, 150
     ANIMATION_MS = 350
-    POLL_FAST = 0.5      # When playing
+    POLL_FAST = 10.0     # When playing (only re-syncs the playback clock)
     POLL_SLOW = 2.0      # When paused/idle
+    POLL_BURST = 0.2             # Around track boundaries and after commands (floored at 1 / API_RATE)
+    POLL_BOUNDARY_LEAD = 1.0     # Start bursting this long before track end
+    POLL_BOUNDARY_TAIL = 3.0     # ...and keep bursting this long after it
+    POLL_COMMAND_WINDOW = 2.0    # Burst for this long after a user command
+    POLL_FULL_EVERY = 30.0       # Full /me/player read (device, shuffle, repeat)
+    CLOCK_DRIFT_MS = 1500        # Ignore smaller clock/server differences
     CACHE_MAX = 50       # Max cached images/colors
+    PIXMAP_CACHE_BYTES = 32 * 1024 * 1024    # Decoded pixmap memory budget (w*h*4)
+    ROUNDED_CACHE_BYTES = 8 * 1024 * 1024    # Pre-rendered rounded art budget
+    ART_SIZE_COLLAPSED = 36      # Album art label size (logical px)
+    ART_SIZE_EXPANDED = 48
+    ART_RADIUS = 8
+    ART_CACHE_DIR = ".art_cache"         # On-disk album art cache (under BASE_DIR)
+    ART_CACHE_BYTES = 64 * 1024 * 1024   # Disk budget before LRU eviction
+    COLOR_INDEX_FILE = ".color_index.sqlite"   # Persistent album -> accent colors
+    COLOR_INDEX_FLUSH_S = 5.0            # Batch new colors into one write
+    IMAGE_WORKERS = 2    # Album art fetch/decode/analyze threads
+    IMAGE_PROCESS_POOL = False   # Decode/analyze in worker processes (keeps the GIL free)
+    IMAGE_PROCESSES = 1          # Size of that pool
+    FRAME_BUDGET_MS = 1000 / 60  # One frame at 60 Hz
+    FRAME_STATS = False          # Print expand/collapse frame timing
+    COLOR_SAMPLE_SIZE = 128  # Pixels per side sampled for the accent (0 = every pixel)
+    PALETTE_SIZE = 5             # Color clusters per album
+    PALETTE_ITERATIONS = 10      # Mini-batch k-means steps
+    PALETTE_BATCH = 1024         # Pixels per k-means step
+    PALETTE_MIN_SHARE = 0.05     # Smallest cluster share usable as the accent
+    PALETTE_MIN_SATURATION = 0.25    # Grayer clusters only win if nothing else does
+    PALETTE_TINT = 0.2           # Max blend of the album color into the card
+    UI_CONTRAST = 3.0            # WCAG minimum for icons/controls (1.4.11)
+    TEXT_CONTRAST = 4.5          # WCAG AA minimum for text (1.4.3)
+    COMMAND_WORKERS = 1  # Player commands in flight at once (1 keeps strict order)
+    OPTIMISTIC_HOLD = 1.5    # Seconds to trust an optimistic UI change over stale polls
+    
+    # Web API request governor
+    API_RATE = 2.0               # Sustained requests per second
+    API_BURST = 8                # Token bucket size
+    API_TOKEN_WAIT = 1.0         # Max seconds a caller waits for a token
+    API_BACKOFF_BASE = 1.0       # First error backoff (doubles per failure)
+    API_BACKOFF_MAX = 60.0
+    API_BREAKER_THRESHOLD = 5    # Consecutive failures that open the circuit
+    API_BREAKER_RESET = 30.0     # Seconds before a trial request is allowed
+    API_BACKGROUND_RESERVE = 4   # Tokens background requests must leave untouched
+    PREFETCH_DEPTH = 3           # Upcoming queue items to warm caches for
+    PREFETCH_EVERY = 30.0        # Re-read the queue this often while playing
+    PREFETCH_RETRY = 5.0         # ...or this soon after being deferred
+    LIKED_TTL = 600.0            # Re-check like status (changed elsewhere) after this
+    
+    # Shared HTTP connection pool
+    HTTP_POOL_HOSTS = 8          # api, accounts and image CDN hosts
+    HTTP_POOL_PER_HOST = 4       # Keep-alive connections per host
+    
+    # OAuth token refresh
+    TOKEN_REFRESH_MARGIN = 300   # Refresh this many seconds before expiry
+    TOKEN_EXPIRY_SLACK = 10      # Tokens closer than this to expiry count as expired
+    TOKEN_RETRY = 30             # Seconds between failed refresh attempts
 
 
 # Spotify API credentials (loaded from .env)
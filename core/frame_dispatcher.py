@@ -0,0 +1,63 @@
+"""
+🎞️ Frame Dispatcher Module
+━━━━━━━━━━━━━━━━━━━━━━━━━
+Coalesces UI updates so each part of the window is touched once per frame
+"""
+
+import time
+
+from PySide6.QtCore import QObject, QTimer, Qt
+
+from .config import Config
+
+
+class FrameDispatcher(QObject):
+    """Queue of pending widget updates, applied at most once per frame.
+
+    `post(key, fn, *args)` records that the part of the UI named `key`
+    needs `fn(*args)`. Posting the same key again before the next flush
+    replaces the pending call, so a burst of signals (track change,
+    palette, like status, playback delta) collapses into one update per
+    key. Flushes are aligned to the frame budget: the first post after
+    an idle period is applied on the next event loop turn, anything
+    posted within the same frame waits for the next one.
+    """
+
+    def __init__(self, parent=None, budget_ms=None):
+        super().__init__(parent)
+        self.budget_ms = budget_ms or Config.FRAME_BUDGET_MS
+        self._pending = {}          # key -> (fn, args), in first-posted order
+        self._last_flush = 0.0
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.timeout.connect(self.flush)
+        self._stats = {'posted': 0, 'merged': 0, 'applied': 0, 'flushes': 0}
+
+    def post(self, key, fn, *args):
+        """Apply `fn(*args)` with the next frame, replacing any pending `key`"""
+        self._stats['posted'] += 1
+        if key in self._pending:
+            self._stats['merged'] += 1
+        self._pending[key] = (fn, args)
+        if not self._timer.isActive():
+            wait = self._last_flush + self.budget_ms / 1000 - time.perf_counter()
+            self._timer.start(max(0, round(wait * 1000)))
+
+    def flush(self):
+        """Apply everything pending now (posts made meanwhile wait a frame)"""
+        self._timer.stop()
+        pending, self._pending = self._pending, {}
+        self._last_flush = time.perf_counter()
+        if not pending:
+            return
+        self._stats['flushes'] += 1
+        for key, (fn, args) in pending.items():
+            try:
+                fn(*args)
+                self._stats['applied'] += 1
+            except Exception as e:
+                print(f"UI update error ({key}): {e}")
+
+    def stats(self):
+        return dict(self._stats)
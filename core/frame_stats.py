@@ -0,0 +1,50 @@
+"""
+⏱️ Frame Stats Module
+━━━━━━━━━━━━━━━━━━━━
+Inter-frame timing for animations, to make jank measurable
+"""
+
+import time
+
+from .config import Config
+
+
+class FrameStats:
+    """Collects gaps between animation frames.
+
+    Call `start()` when an animation begins, `tick()` on every frame and
+    `summary()` when it ends. A frame counts as janky when its gap is
+    more than twice the frame budget (at least one frame was dropped).
+    """
+
+    def __init__(self, budget_ms=None):
+        self.budget_ms = budget_ms or Config.FRAME_BUDGET_MS
+        self._last = None
+        self._gaps = []
+
+    def start(self):
+        self._last = time.perf_counter()
+        self._gaps = []
+
+    def tick(self):
+        now = time.perf_counter()
+        if self._last is not None:
+            self._gaps.append((now - self._last) * 1000)
+        self._last = now
+
+    def summary(self):
+        gaps = sorted(self._gaps)
+        if not gaps:
+            return {'frames': 0, 'mean_ms': 0.0, 'p95_ms': 0.0, 'max_ms': 0.0, 'janky': 0}
+        return {
+            'frames': len(gaps),
+            'mean_ms': sum(gaps) / len(gaps),
+            'p95_ms': gaps[min(len(gaps) - 1, int(len(gaps) * 0.95))],
+            'max_ms': gaps[-1],
+            'janky': sum(g > 2 * self.budget_ms for g in gaps),
+        }
+
+    def format(self, label="frames"):
+        s = self.summary()
+        return (f"{label}: {s['frames']} frames, mean {s['mean_ms']:.1f}ms, "
+                f"p95 {s['p95_ms']:.1f}ms, max {s['max_ms']:.1f}ms, janky {s['janky']}")
@@ -0,0 +1,193 @@
+"""
+🚦 Request Governor Module
+━━━━━━━━━━━━━━━━━━━━━━━━━
+Shared rate limiting, backoff and circuit breaking for Web API calls
+"""
+
+import random
+import threading
+import time
+
+from .config import Config
+
+
+class RequestRejected(Exception):
+    """The governor refused to send a request (cooling down or circuit open)"""
+
+    def __init__(self, reason, retry_in=0.0):
+        super().__init__(f"{reason} (retry in {retry_in:.1f}s)")
+        self.reason = reason
+        self.retry_in = retry_in
+
+
+class RequestGovernor:
+    """Gatekeeper for every Spotify Web API request.
+
+    - Token bucket: at most `rate` requests/s sustained, `burst` at once
+    - 429: honors the Retry-After header before sending anything else
+    - Network/5xx errors: exponential backoff with jitter
+    - After API_BREAKER_THRESHOLD consecutive failures the circuit opens
+      and requests are rejected for API_BREAKER_RESET seconds; then one
+      trial request is let through (half-open)
+    - Background requests (prefetch) only spend tokens above a reserve
+      kept for interactive ones, and never wait
+    """
+
+    def __init__(self, rate=None, burst=None):
+        self.rate = Config.API_RATE if rate is None else rate
+        self.burst = Config.API_BURST if burst is None else burst
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._refilled_at = time.monotonic()
+        self._blocked_until = 0.0
+        self._failures = 0
+        self._circuit_open_until = 0.0
+        self._half_open = False
+        self._counters = {
+            'requests': 0, 'succeeded': 0, 'failed': 0, 'throttled': 0,
+            'rejected': 0, 'circuit_opens': 0, 'token_waits': 0,
+            'background': 0, 'deferred': 0,
+        }
+
+    # ──────────────────────────────────────────────────────────
+
+    def call(self, fn, *args, **kwargs):
+        """Run `fn(*args, **kwargs)` under the governor's rules.
+
+        Raises RequestRejected instead of sending when the API should be
+        left alone; errors from `fn` are recorded and re-raised.
+        """
+        self._admit()
+        return self._send(fn, args, kwargs)
+
+    def call_background(self, fn, *args, **kwargs):
+        """Like call(), for requests nobody is waiting on.
+
+        Rejected unless a token is free on top of API_BACKGROUND_RESERVE,
+        and never used as the half-open trial request.
+        """
+        self._admit(reserve=Config.API_BACKGROUND_RESERVE)
+        return self._send(fn, args, kwargs)
+
+    def _send(self, fn, args, kwargs):
+        try:
+            result = fn(*args, **kwargs)
+        except Exception as e:
+            self._record_error(e)
+            raise
+        self._record_success()
+        return result
+
+    def retry_in(self):
+        """Seconds until requests will be admitted again (0 if open now)"""
+        with self._lock:
+            now = time.monotonic()
+            return max(0.0, self._blocked_until - now, self._circuit_open_until - now)
+
+    @property
+    def state(self):
+        with self._lock:
+            if self._circuit_open_until > time.monotonic():
+                return 'open'
+            return 'half-open' if self._half_open else 'closed'
+
+    def stats(self):
+        with self._lock:
+            out = dict(self._counters)
+            out['consecutive_failures'] = self._failures
+            out['tokens'] = round(self._tokens, 2)
+        out['state'] = self.state
+        out['retry_in'] = round(self.retry_in(), 2)
+        return out
+
+    # ──────────────────────────────────────────────────────────
+
+    def _refill(self, now):
+        elapsed = now - self._refilled_at
+        self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+        self._refilled_at = now
+
+    def _admit(self, reserve=0):
+        deadline = time.monotonic() + Config.API_TOKEN_WAIT
+        waited = False
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if self._circuit_open_until > now:
+                    self._counters['rejected'] += 1
+                    raise RequestRejected("circuit open", self._circuit_open_until - now)
+                if self._half_open and not self._circuit_open_until:
+                    self._counters['rejected'] += 1
+                    raise RequestRejected("waiting for trial request", 1.0)
+                if self._blocked_until > now:
+                    self._counters['rejected'] += 1
+                    raise RequestRejected("backing off", self._blocked_until - now)
+
+                if reserve and self._half_open:
+                    self._counters['deferred'] += 1
+                    raise RequestRejected("recovering, background paused", 1.0)
+
+                self._refill(now)
+                if reserve and self._tokens < 1 + reserve:
+                    self._counters['deferred'] += 1
+                    raise RequestRejected("budget reserved for interactive requests",
+                                          (1 + reserve - self._tokens) / self.rate)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    self._counters['requests'] += 1
+                    if reserve:
+                        self._counters['background'] += 1
+                    if self._half_open:
+                        # Circuit reset has elapsed: this request is the single trial
+                        self._circuit_open_until = 0.0
+                    if waited:
+                        self._counters['token_waits'] += 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+                if now + wait > deadline:
+                    self._counters['rejected'] += 1
+                    raise RequestRejected("rate limited locally", wait)
+            waited = True
+            time.sleep(wait)
+
+    def _record_success(self):
+        with self._lock:
+            self._counters['succeeded'] += 1
+            self._failures = 0
+            self._half_open = False
+
+    def _record_error(self, error):
+        status = getattr(error, 'http_status', None)
+        with self._lock:
+            now = time.monotonic()
+            self._counters['failed'] += 1
+            if status == 429:
+                self._counters['throttled'] += 1
+                self._blocked_until = max(self._blocked_until, now + _retry_after(error))
+                self._half_open = False
+                return
+            if status is not None and 400 <= status < 500:
+                # Client errors (no active device, Premium required...) say
+                # nothing about the API's health - but it did answer
+                self._failures = 0
+                self._half_open = False
+                return
+
+            self._failures += 1
+            if self._half_open or self._failures >= Config.API_BREAKER_THRESHOLD:
+                self._counters['circuit_opens'] += 1
+                self._circuit_open_until = now + Config.API_BREAKER_RESET
+                self._half_open = True
+                return
+            delay = min(Config.API_BACKOFF_MAX,
+                        Config.API_BACKOFF_BASE * 2 ** (self._failures - 1))
+            # Equal jitter: never less than half the delay, never in lockstep
+            self._blocked_until = now + delay / 2 + random.uniform(0, delay / 2)
+
+
+def _retry_after(error):
+    headers = getattr(error, 'headers', None) or {}
+    try:
+        return max(0.0, float(headers.get('Retry-After', Config.API_BACKOFF_BASE)))
+    except (TypeError, ValueError):
+        return Config.API_BACKOFF_BASE
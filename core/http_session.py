@@ -0,0 +1,72 @@
+"""
+🌐 HTTP Session Module
+━━━━━━━━━━━━━━━━━━━━━
+One pooled keep-alive session for Spotify API calls and album art
+"""
+
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .config import Config
+
+_session = None
+_lock = threading.Lock()
+
+
+def create_session():
+    """Build a requests session tuned for a handful of long-lived hosts"""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=Config.HTTP_POOL_HOSTS,    # Hosts kept alive at once
+        pool_maxsize=Config.HTTP_POOL_PER_HOST,     # Connections per host
+        pool_block=True,                            # ...and never more than that
+        max_retries=0,                              # Retries belong to the governor
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({
+        'Accept-Encoding': 'gzip, deflate',
+        'Connection': 'keep-alive',
+        'User-Agent': 'DynamicIslandSpotify',
+    })
+    return session
+
+
+def get_session():
+    """The process-wide shared session (created on first use)"""
+    global _session
+    if _session is None:
+        with _lock:
+            if _session is None:
+                _session = create_session()
+    return _session
+
+
+def session_stats():
+    """Per-host request and connection counts from the urllib3 pools.
+
+    `reuse` is the share of requests that went over an existing
+    keep-alive connection instead of a fresh TCP+TLS handshake.
+    """
+    if _session is None:
+        return {}
+    stats = {}
+    for adapter in set(_session.adapters.values()):
+        pools = getattr(adapter.poolmanager, 'pools', None)
+        if pools is None:
+            continue
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            host = f"{pool.host}:{pool.port}" if pool.port else pool.host
+            requests_made = pool.num_requests
+            connections = pool.num_connections
+            stats[host] = {
+                'requests': requests_made,
+                'connections': connections,
+                'reuse': round(1 - connections / requests_made, 3) if requests_made else 0.0,
+            }
+    return stats
@@ -0,0 +1,140 @@
+"""
+🖼️ Image Pipeline Module
+━━━━━━━━━━━━━━━━━━━━━━━
+Fetch, decode and analyze each album image exactly once
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from PySide6.QtGui import QImage
+
+from .analysis_pool import Image, decode_and_analyze, get_analysis_pool
+from .art_cache import get_art_cache
+from .color_index import get_color_index
+from .config import Config
+from .http_session import get_session
+
+_pipeline = None
+_lock = threading.Lock()
+
+
+class ImageResult:
+    """Output of one pipeline run"""
+
+    __slots__ = ('url', 'color_key', 'color', 'palette', 'image')
+
+    def __init__(self, url, color_key, color, image, palette=None):
+        self.url = url
+        self.color_key = color_key
+        self.color = color      # Accent hex, or None if it couldn't be computed
+        self.palette = palette  # Role palette (see core.palette), or None
+        self.image = image      # QImage, or None if decoding failed
+
+
+def rgb_to_qimage(pixels, w, h):
+    """Owned QImage copied from a tightly packed RGB888 buffer"""
+    return QImage(pixels, w, h, 3 * w, QImage.Format_RGB888).copy()
+
+
+class ImagePipeline:
+    """Single fetch → decode → analyze stage for album art.
+
+    Concurrent requests for the same URL share one in-flight job (and so
+    one download). Each job decodes the bytes once and fans the decoded
+    buffer out to palette analysis and QImage creation. Palettes go to the
+    persistent color index; known palettes skip analysis entirely.
+    With IMAGE_PROCESS_POOL the decode/analyze step runs in worker
+    processes and these threads only do I/O and wait.
+    """
+
+    def __init__(self, workers=None):
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers or Config.IMAGE_WORKERS, thread_name_prefix="image")
+        self._pool = get_analysis_pool()
+        if self._pool is not None:
+            self._pool.warm()
+        self._lock = threading.Lock()
+        self._inflight = {}     # url -> Future
+        self._stats = {'jobs': 0, 'deduped': 0, 'downloads': 0, 'analyzed': 0}
+
+    def submit(self, url, color_key=None):
+        """Future resolving to an ImageResult for `url`"""
+        with self._lock:
+            future = self._inflight.get(url)
+            if future is not None:
+                self._stats['deduped'] += 1
+                return future
+            self._stats['jobs'] += 1
+            future = self._executor.submit(self._run, url, color_key or url)
+            self._inflight[url] = future
+        future.add_done_callback(lambda f: self._done(url, f))
+        return future
+
+    def _done(self, url, future):
+        with self._lock:
+            if self._inflight.get(url) is future:
+                del self._inflight[url]
+
+    def fetch(self, url):
+        """Image bytes from the disk cache, downloading on a miss"""
+        art_cache = get_art_cache()
+        data = art_cache.get(url)
+        if data is None:
+            response = get_session().get(url, timeout=10)
+            response.raise_for_status()
+            data = response.content
+            self._count('downloads')
+            art_cache.put(url, data)
+        return data
+
+    def _run(self, url, color_key):
+        data = self.fetch(url)
+        entry = get_color_index().get_entry(color_key)
+        color, palette = entry if entry else (None, None)
+
+        if Image is None:
+            image = QImage()
+            if not image.loadFromData(data):
+                image = None
+            return ImageResult(url, color_key, color, image, palette)
+
+        # Decode once, analyze the decoded pixels (older index entries only
+        # hold an accent) and build the QImage from the same buffer
+        want_palette = palette is None
+        if self._pool is not None:
+            image, found = self._pool.analyze(data, want_palette, rgb_to_qimage)
+        else:
+            decoded, found = decode_and_analyze(data, want_palette)
+            image = rgb_to_qimage(decoded.tobytes(), *decoded.size)
+
+        if found:
+            palette, color = found, found['accent']
+            self._count('analyzed')
+            get_color_index().put(color_key, color, palette)
+        return ImageResult(url, color_key, color, image, palette)
+
+    def _count(self, name):
+        with self._lock:
+            self._stats[name] += 1
+
+    def stats(self):
+        with self._lock:
+            s = dict(self._stats)
+            s['inflight'] = len(self._inflight)
+        return s
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        if self._pool is not None:
+            self._pool.shutdown()
+
+
+def get_image_pipeline():
+    """The process-wide image pipeline"""
+    global _pipeline
+    if _pipeline is None:
+        with _lock:
+            if _pipeline is None:
+                _pipeline = ImagePipeline()
+    return _pipeline
@@ -0,0 +1,108 @@
+"""
+💚 Liked Cache Module
+━━━━━━━━━━━━━━━━━━━━
+Batched, TTL-bounded cache of "is this track in Liked Songs"
+"""
+
+import threading
+import time
+
+from .config import Config
+
+MAX_IDS = 50    # Web API limit for /me/tracks/contains
+
+
+class LikedCache:
+    """Liked status per track id.
+
+    Misses are answered with one `fetch(ids)` call per 50 ids. Ids
+    registered with `want()` (e.g. the upcoming queue) ride along with
+    the next lookup, so the current track and what follows it cost a
+    single request. Entries expire after LIKED_TTL seconds to pick up
+    likes made in other clients; our own toggles are written locally.
+    """
+
+    def __init__(self, fetch, ttl=None):
+        self._fetch = fetch
+        self.ttl = Config.LIKED_TTL if ttl is None else ttl
+        self._lock = threading.Lock()
+        self._entries = {}          # track_id -> (liked, expires_at)
+        self._wanted = []
+        self._stats = {'hits': 0, 'misses': 0, 'requests': 0, 'local_writes': 0}
+
+    def get(self, track_id):
+        """Cached status, or None if unknown or expired"""
+        with self._lock:
+            return self._get(track_id, time.monotonic())
+
+    def _get(self, track_id, now):
+        entry = self._entries.get(track_id)
+        if entry is None or entry[1] <= now:
+            return None
+        return entry[0]
+
+    def set(self, track_id, liked):
+        """Record a status we know (after our own save/remove)"""
+        with self._lock:
+            self._entries[track_id] = (liked, time.monotonic() + self.ttl)
+            self._stats['local_writes'] += 1
+
+    def want(self, track_ids):
+        """Queue ids to be fetched along with the next lookup"""
+        with self._lock:
+            now = time.monotonic()
+            for track_id in track_ids:
+                if track_id and track_id not in self._wanted and self._get(track_id, now) is None:
+                    self._wanted.append(track_id)
+            del self._wanted[:-MAX_IDS]
+
+    def lookup(self, track_ids, fetch=None):
+        """{track_id: liked} for `track_ids`, fetching misses in batches"""
+        now = time.monotonic()
+        result, missing = {}, []
+        with self._lock:
+            for track_id in track_ids:
+                liked = self._get(track_id, now)
+                if liked is None:
+                    missing.append(track_id)
+                else:
+                    result[track_id] = liked
+            self._stats['hits'] += len(result)
+            self._stats['misses'] += len(missing)
+            if missing:
+                # Fill the batch up with wanted ids
+                extra = [i for i in self._wanted if i not in missing]
+                missing += extra[:max(0, MAX_IDS - len(missing))]
+
+        for start in range(0, len(missing), MAX_IDS):
+            batch = missing[start:start + MAX_IDS]
+            saved = (fetch or self._fetch)(batch)
+            with self._lock:
+                self._stats['requests'] += 1
+                expires = time.monotonic() + self.ttl
+                for track_id, liked in zip(batch, saved):
+                    self._entries[track_id] = (bool(liked), expires)
+                    if track_id in self._wanted:
+                        self._wanted.remove(track_id)
+                    if track_id in track_ids:
+                        result[track_id] = bool(liked)
+                self._prune(expires - self.ttl)
+        return result
+
+    def _prune(self, now):
+        if len(self._entries) > 4 * MAX_IDS:
+            for track_id in [k for k, (_, exp) in self._entries.items() if exp <= now]:
+                del self._entries[track_id]
+
+    def flush_wanted(self, fetch=None):
+        """Fetch whatever `want()` queued, if anything"""
+        with self._lock:
+            wanted = list(self._wanted)
+        return self.lookup(wanted, fetch) if wanted else {}
+
+    def stats(self):
+        with self._lock:
+            s = dict(self._stats)
+            s['entries'] = len(self._entries)
+            s['wanted'] = len(self._wanted)
+        return s
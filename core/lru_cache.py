@@ -0,0 +1,81 @@
+"""
+🧠 LRU Cache Module
+━━━━━━━━━━━━━━━━━━
+Thread-safe least-recently-used cache bounded by count and bytes
+"""
+
+import threading
+from collections import OrderedDict
+
+
+class LRUCache:
+    """True LRU cache with entry and memory limits.
+
+    `sizeof(value)` estimates each entry's memory (e.g. w*h*4 for a
+    pixmap); with `max_bytes` set, least recently used entries are
+    evicted until both limits hold.
+    """
+
+    def __init__(self, max_entries, max_bytes=None, sizeof=None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof or (lambda value: 0)
+        self._lock = threading.Lock()
+        self._data = OrderedDict()     # key -> (value, size)
+        self._bytes = 0
+        self._stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self._stats['misses'] += 1
+                return default
+            self._data.move_to_end(key)
+            self._stats['hits'] += 1
+            return entry[0]
+
+    def put(self, key, value):
+        size = self._sizeof(value)
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._data[key] = (value, size)
+            self._bytes += size
+            self._evict()
+
+    def pop(self, key, default=None):
+        with self._lock:
+            entry = self._data.pop(key, None)
+            if entry is None:
+                return default
+            self._bytes -= entry[1]
+            return entry[0]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+    def _evict(self):
+        while self._data and (
+                len(self._data) > self.max_entries
+                or (self.max_bytes is not None and self._bytes > self.max_bytes)):
+            _, (_, size) = self._data.popitem(last=False)
+            self._bytes -= size
+            self._stats['evictions'] += 1
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._data
+
+    def __len__(self):
+        return len(self._data)
+
+    def stats(self):
+        with self._lock:
+            s = dict(self._stats)
+            s['entries'] = len(self._data)
+            s['bytes'] = self._bytes
+        return s
@@ -0,0 +1,142 @@
+"""
+🌈 Palette Module
+━━━━━━━━━━━━━━━━
+Album art palettes with contrast-checked color roles
+"""
+
+from .color_extract import boost_dark_color, dominant_rgb, np, quantize, sample_pixels, to_hex
+from .config import Colors, Config
+
+WHITE = (255, 255, 255)
+BLACK = (0, 0, 0)
+
+
+def hex_to_rgb(color):
+    color = color.lstrip('#')
+    return tuple(int(color[i:i + 2], 16) for i in (0, 2, 4))
+
+
+def luminance(rgb):
+    """WCAG 2.x relative luminance"""
+    def channel(c):
+        c /= 255
+        return c / 12.92 if c <= 0.03928 else ((c + 0.055) / 1.055) ** 2.4
+    r, g, b = (channel(c) for c in rgb)
+    return 0.2126 * r + 0.7152 * g + 0.0722 * b
+
+
+def contrast_ratio(a, b):
+    """WCAG contrast ratio (1-21) between two RGB tuples"""
+    la, lb = luminance(a), luminance(b)
+    return (max(la, lb) + 0.05) / (min(la, lb) + 0.05)
+
+
+def saturation(rgb):
+    """HSV saturation (0-1)"""
+    hi = max(rgb)
+    return (hi - min(rgb)) / hi if hi else 0.0
+
+
+def mix(a, b, t):
+    """Blend from `a` (t=0) to `b` (t=1)"""
+    return tuple(int(round(x + (y - x) * t)) for x, y in zip(a, b))
+
+
+def _nearest(pixels, centers):
+    """Index of the closest center for every pixel"""
+    d = ((pixels * pixels).sum(axis=1)[:, None]
+         - 2 * pixels @ centers.T
+         + (centers * centers).sum(axis=1)[None, :])
+    return d.argmin(axis=1)
+
+
+def kmeans(pixels, centers, iterations=None, batch=None, seed=0):
+    """Mini-batch k-means (Sculley 2010) over float32 (N, 3) pixels.
+
+    Each step moves a center toward the mean of its batch members with a
+    per-center 1/n learning rate - the batched form of the per-sample update.
+    """
+    iterations = Config.PALETTE_ITERATIONS if iterations is None else iterations
+    batch = batch or Config.PALETTE_BATCH
+    rng = np.random.default_rng(seed)
+    centers = centers.copy()
+    k = len(centers)
+    seen = np.zeros(k)
+    for _ in range(iterations):
+        sample = pixels if len(pixels) <= batch else pixels[rng.integers(0, len(pixels), batch)]
+        labels = _nearest(sample, centers)
+        counts = np.bincount(labels, minlength=k)
+        sums = np.stack([np.bincount(labels, weights=sample[:, c], minlength=k)
+                         for c in range(3)], axis=1)
+        seen += counts
+        hit = counts > 0
+        rate = (counts[hit] / seen[hit])[:, None]
+        centers[hit] += rate * (sums[hit] / counts[hit, None] - centers[hit])
+    return centers
+
+
+def clusters(image, k=None, max_side=None):
+    """[(rgb, share)] color clusters of a PIL image, most populous first"""
+    if np is None:
+        return [(dominant_rgb(image, max_side), 1.0)]
+    k = k or Config.PALETTE_SIZE
+    pixels = sample_pixels(image, max_side)
+    # Median-cut seeds make the result deterministic and converge quickly
+    seeds = np.array(quantize(pixels, k), dtype=np.float32)
+    pixels = pixels.astype(np.float32)
+    centers = kmeans(pixels, seeds)
+    counts = np.bincount(_nearest(pixels, centers), minlength=len(centers))
+    order = np.argsort(-counts, kind='stable')
+    return [(tuple(int(round(c)) for c in np.clip(centers[i], 0, 255)), counts[i] / len(pixels))
+            for i in order if counts[i]]
+
+
+def _lift(rgb, background, ratio):
+    """Move `rgb` away from `background` until it reaches `ratio`"""
+    target = WHITE if contrast_ratio(WHITE, background) >= contrast_ratio(BLACK, background) else BLACK
+    for step in range(21):
+        color = mix(rgb, target, step / 20)
+        if contrast_ratio(color, background) >= ratio:
+            return color
+    return target
+
+
+def _tint(rgb, background):
+    """Strongest blend of `rgb` into the card that keeps both text colors readable"""
+    text, dim = hex_to_rgb(Colors.TEXT), hex_to_rgb(Colors.TEXT_DIM)
+    strength = Config.PALETTE_TINT
+    for step in range(10, -1, -1):
+        color = mix(background, rgb, strength * step / 10)
+        if (contrast_ratio(text, color) >= Config.TEXT_CONTRAST
+                and contrast_ratio(dim, color) >= Config.TEXT_CONTRAST):
+            return color
+    return background
+
+
+def assign_roles(swatches, background=None):
+    """Palette dict with accent, background tint and text-safe colors.
+
+    - accent: most populous colorful swatch, brightness-boosted when dark
+              and then lifted to UI-component contrast
+    - tint:   dominant swatch blended into the card (dim text stays readable)
+    - text:   accent-tinted white with text contrast against the tint
+    """
+    bg = hex_to_rgb(background or Colors.CARD)
+    dominant = swatches[0][0]
+    accent = next((rgb for rgb, share in swatches
+                   if share >= Config.PALETTE_MIN_SHARE
+                   and saturation(rgb) >= Config.PALETTE_MIN_SATURATION), dominant)
+    accent = _lift(boost_dark_color(*accent), bg, Config.UI_CONTRAST)
+    tint = _tint(dominant, bg)
+    text = _lift(mix(WHITE, accent, 0.3), tint, Config.TEXT_CONTRAST)
+    return {
+        'accent': to_hex(accent),
+        'tint': to_hex(tint),
+        'text': to_hex(text),
+        'swatches': [to_hex(rgb) for rgb, _ in swatches],
+    }
+
+
+def extract_palette(image, max_side=None):
+    """Role palette for a decoded PIL image (one vectorized pass)"""
+    return assign_roles(clusters(image, max_side=max_side))
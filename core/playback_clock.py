@@ -0,0 +1,109 @@
+"""
+⏱️ Playback Clock Module
+━━━━━━━━━━━━━━━━━━━━━━━
+Local playback position extrapolated from the last server sync
+"""
+
+import threading
+import time
+
+from .config import Config
+
+
+class PlaybackClock:
+    """Thread-safe playback clock that advances locally while playing.
+
+    The worker re-syncs it from server snapshots; the UI reads from it
+    between polls so the progress bar keeps moving without API calls.
+    """
+
+    def __init__(self, drift_tolerance_ms=None):
+        self._lock = threading.Lock()
+        self.drift_tolerance_ms = (
+            Config.CLOCK_DRIFT_MS if drift_tolerance_ms is None else drift_tolerance_ms
+        )
+        self._track_id = None
+        self._progress_ms = 0
+        self._duration_ms = 0
+        self._is_playing = False
+        self._synced_at = time.monotonic()
+        self.last_drift_ms = 0
+
+    def _position_at(self, now):
+        pos = self._progress_ms
+        if self._is_playing:
+            pos += int((now - self._synced_at) * 1000)
+        if self._duration_ms:
+            pos = min(pos, self._duration_ms)
+        return max(0, pos)
+
+    def sync(self, track_id, progress_ms, duration_ms, is_playing, synced_at=None):
+        """Re-sync from a server snapshot.
+
+        `synced_at` is the monotonic time the snapshot was taken (ideally
+        the midpoint of the request). Small drift on the same track and
+        play state is ignored so the bar never jitters backwards.
+        Returns True if the clock was reset.
+        """
+        now = time.monotonic() if synced_at is None else synced_at
+        with self._lock:
+            drift = progress_ms - self._position_at(now)
+            self.last_drift_ms = drift
+            same = (track_id == self._track_id and is_playing == self._is_playing
+                    and duration_ms == self._duration_ms)
+            if same and abs(drift) <= self.drift_tolerance_ms:
+                return False
+            self._track_id = track_id
+            self._progress_ms = progress_ms
+            self._duration_ms = duration_ms
+            self._is_playing = is_playing
+            self._synced_at = now
+            return True
+
+    def seek(self, position_ms):
+        """Jump to a position locally (e.g. after a user seek)"""
+        with self._lock:
+            self._progress_ms = max(0, position_ms)
+            self._synced_at = time.monotonic()
+
+    def set_playing(self, is_playing):
+        """Freeze or resume the clock at the current position"""
+        with self._lock:
+            now = time.monotonic()
+            self._progress_ms = self._position_at(now)
+            self._synced_at = now
+            self._is_playing = is_playing
+
+    def reset(self):
+        with self._lock:
+            self._track_id = None
+            self._progress_ms = 0
+            self._duration_ms = 0
+            self._is_playing = False
+            self._synced_at = time.monotonic()
+
+    def position_ms(self):
+        with self._lock:
+            return self._position_at(time.monotonic())
+
+    def remaining_ms(self):
+        """Time until the expected track end; negative once it is overdue"""
+        with self._lock:
+            if not self._duration_ms:
+                return None
+            pos = self._progress_ms
+            if self._is_playing:
+                pos += int((time.monotonic() - self._synced_at) * 1000)
+            return self._duration_ms - pos
+
+    @property
+    def duration_ms(self):
+        return self._duration_ms
+
+    @property
+    def is_playing(self):
+        return self._is_playing
+
+    @property
+    def track_id(self):
+        return self._track_id
@@ -0,0 +1,134 @@
+"""
+📦 Playback State Module
+━━━━━━━━━━━━━━━━━━━━━━━
+Compact parsed playback snapshot with field-level diffing
+"""
+
+
+class TrackInfo:
+    """What the island shows about the current track or episode"""
+
+    __slots__ = ('id', 'name', 'artist', 'album_id', 'images', 'duration_ms', 'is_episode')
+
+    def __init__(self, id, name, artist, album_id, images, duration_ms, is_episode=False):
+        self.id = id
+        self.name = name
+        self.artist = artist
+        self.album_id = album_id
+        self.images = images            # [{'url', 'width'}], largest first
+        self.duration_ms = duration_ms
+        self.is_episode = is_episode
+
+    @classmethod
+    def from_item(cls, item):
+        """Pull the display fields out of a track or episode object"""
+        if item.get('type') == 'episode':
+            show = item.get('show') or {}
+            artist = show.get('publisher') or show.get('name') or ''
+            album_id = show.get('id')
+            images = item.get('images') or show.get('images') or []
+        else:
+            artists = item.get('artists') or []
+            artist = artists[0].get('name', '') if artists else ''
+            album = item.get('album') or {}
+            album_id = album.get('id')
+            images = album.get('images') or []
+        return cls(
+            id=item.get('id'),
+            name=item.get('name') or '',
+            artist=artist,
+            album_id=album_id,
+            images=[{'url': img['url'], 'width': img.get('width') or 0} for img in images],
+            duration_ms=item.get('duration_ms') or 0,
+            is_episode=item.get('type') == 'episode',
+        )
+
+    def art_url(self, min_px):
+        """Smallest art variant at least `min_px` wide (else the largest)"""
+        if not self.images:
+            return None
+        sized = [img for img in self.images if img['width']]
+        if not sized:
+            return self.images[-1]['url']
+        fits = [img for img in sized if img['width'] >= min_px]
+        best = min(fits, key=lambda img: img['width']) if fits else max(sized, key=lambda img: img['width'])
+        return best['url']
+
+
+class PlaybackState:
+    """The handful of playback fields the UI cares about"""
+
+    __slots__ = (
+        'track_id', 'is_playing', 'shuffle', 'repeat',
+        'volume', 'progress_ms', 'duration_ms', 'device_id',
+    )
+
+    def __init__(self, track_id=None, is_playing=False, shuffle=False, repeat='off',
+                 volume=50, progress_ms=0, duration_ms=0, device_id=None):
+        self.track_id = track_id
+        self.is_playing = is_playing
+        self.shuffle = shuffle
+        self.repeat = repeat
+        self.volume = volume
+        self.progress_ms = progress_ms
+        self.duration_ms = duration_ms
+        self.device_id = device_id
+
+    @classmethod
+    def from_response(cls, data, previous=None):
+        """Parse a player response, or None if nothing is playing.
+
+        Accepts both `/me/player` and the leaner `/me/player/currently-playing`;
+        fields the latter lacks (shuffle, repeat, device) carry over from
+        `previous`.
+        """
+        if not data or not data.get('item'):
+            return None
+        item = data['item']
+        state = cls(
+            track_id=item.get('id'),
+            is_playing=bool(data.get('is_playing', False)),
+            progress_ms=data.get('progress_ms') or 0,
+            duration_ms=item.get('duration_ms') or 0,
+        )
+        if 'device' in data:
+            device = data['device'] or {}
+            volume = device.get('volume_percent')
+            state.volume = 50 if volume is None else volume
+            state.device_id = device.get('id')
+        elif previous is not None:
+            state.volume = previous.volume
+            state.device_id = previous.device_id
+        if 'shuffle_state' in data:
+            state.shuffle = bool(data['shuffle_state'])
+        elif previous is not None:
+            state.shuffle = previous.shuffle
+        if 'repeat_state' in data:
+            state.repeat = data['repeat_state'] or 'off'
+        elif previous is not None:
+            state.repeat = previous.repeat
+        return state
+
+    def diff(self, previous, ignore=('progress_ms',)):
+        """Return {field: new_value} for fields that differ from `previous`.
+
+        Progress changes on every snapshot, so it is ignored by default;
+        the worker reports it separately when the playback clock resyncs.
+        """
+        if previous is None:
+            return {f: getattr(self, f) for f in self.__slots__ if f not in ignore}
+        changes = {}
+        for f in self.__slots__:
+            if f in ignore:
+                continue
+            value = getattr(self, f)
+            if value != getattr(previous, f):
+                changes[f] = value
+        return changes
+
+    def copy(self):
+        return PlaybackState(*(getattr(self, f) for f in self.__slots__))
+
+    def __repr__(self):
+        fields = ', '.join(f"{f}={getattr(self, f)!r}" for f in self.__slots__)
+        return f"PlaybackState({fields})"
@@ -0,0 +1,82 @@
+"""
+🗓️ Poll Scheduler Module
+━━━━━━━━━━━━━━━━━━━━━━━
+Plans the next playback poll from the track boundary and user activity
+"""
+
+import threading
+import time
+
+from .config import Config
+
+
+class PollScheduler:
+    """Decides how long the worker sleeps before the next poll.
+
+    Steady playback polls sparsely (the playback clock covers progress),
+    then bursts around the expected track end and right after user
+    commands so changes show up within about one burst interval. Bursts
+    never poll faster than the governor refills (1 / API_RATE), so they
+    don't drain the tokens user commands and prefetch need.
+    """
+
+    def __init__(self, clock):
+        self.clock = clock
+        self.burst = max(Config.POLL_BURST, 1 / Config.API_RATE)
+        self._wake = threading.Event()
+        self._last_command = 0.0
+        self.polls = 0
+        self.burst_polls = 0
+
+    def note_command(self):
+        """A user command just went out - poll again soon"""
+        self._last_command = time.monotonic()
+        self._wake.set()
+
+    def in_command_window(self):
+        return time.monotonic() - self._last_command < Config.POLL_COMMAND_WINDOW
+
+    def next_delay(self, is_playing):
+        """Seconds until the next poll"""
+        if self.in_command_window():
+            return self.burst
+        if not is_playing:
+            return Config.POLL_SLOW
+
+        remaining = self.clock.remaining_ms()
+        if remaining is None:
+            return Config.POLL_FAST
+        remaining_s = remaining / 1000
+        if remaining_s > Config.POLL_BOUNDARY_LEAD:
+            # Sleep until just before the boundary, but re-sync now and then
+            return min(Config.POLL_FAST, remaining_s - Config.POLL_BOUNDARY_LEAD)
+        if remaining_s > -Config.POLL_BOUNDARY_TAIL:
+            return self.burst
+        # Track should have ended long ago (e.g. end of context) - back off
+        return Config.POLL_SLOW
+
+    def wait(self, is_playing, min_delay=0.0):
+        """Sleep until the next planned poll or until a command wakes us.
+
+        `min_delay` (e.g. a rate-limit cooldown) overrides bursts; a wake
+        (command, stop) still ends it early - the governor keeps enforcing
+        the cooldown on whatever the next poll tries.
+        """
+        delay = self.next_delay(is_playing)
+        self.polls += 1
+        if min_delay > delay:
+            self._wake.wait(min_delay)
+            self._wake.clear()
+            return
+        if delay <= self.burst:
+            self.burst_polls += 1
+        if self._wake.wait(delay):
+            self._wake.clear()
+            # Give Spotify a moment to apply the command before reading back
+            time.sleep(Config.POLL_BURST)
+
+    def wake(self):
+        self._wake.set()
+
+    def stats(self):
+        return {'polls': self.polls, 'burst_polls': self.burst_polls}
@@ -13,7 +13,7 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtCore import Qt
 
-from .config import Colors, Config
+from .config import Colors
 
 
 class SettingsDialog(QDialog):
@@ -230,7 +230,7 @@ class SettingsDialog(QDialog):
     def _reset_position(self):
         if self.parent_window:
             screen = QApplication.primaryScreen().geometry()
-            x = (screen.width() - Config.COLLAPSED_W) // 2
+            x = (screen.width() - self.parent_window.width()) // 2
             self.parent_window.move(x, 10)
             self.parent_window.settings.remove("pos_x")
             self.parent_window.settings.remove("pos_y")
@@ -6,6 +6,7 @@ Background thread for Spotify API calls with adaptive polling
 
 import time
 import os
+import threading
 
 from PySide6.QtCore import Signal, QObject
 import spotipy
@@ -14,82 +15,298 @@ from spotipy.oauth2 import SpotifyOAuth
 from .config import (
     BASE_DIR, CLIENT_ID, CLIENT_SECRET, REDIRECT_URI, SCOPE, Config
 )
+from .command_executor import CommandExecutor
+from .governor import RequestGovernor, RequestRejected
+from .http_session import get_session
+from .liked_cache import LikedCache
+from .playback_clock import PlaybackClock
+from .playback_state import PlaybackState, TrackInfo
+from .poll_scheduler import PollScheduler
+from .token_manager import TokenManager
 
 
 class SpotifyWorker(QObject):
     """Background thread for Spotify API calls with adaptive polling"""
-    track_updated = Signal(dict)
-    playback_updated = Signal(dict)
+    track_updated = Signal(object)      # TrackInfo, or None when nothing plays
+    playback_updated = Signal(dict)     # {field: value} deltas of PlaybackState
+    upcoming_updated = Signal(list)     # TrackInfo of the next PREFETCH_DEPTH queue items
     error = Signal(str)
     
     def __init__(self):
         super().__init__()
         self.running = True
         self.sp = None
+        self.tokens = None
+        self.governor = RequestGovernor()
         self._is_playing = False
+        self.state = None               # What the UI shows (server + optimistic)
+        self._server_state = None       # Last snapshot exactly as the server sent it
+        self._optimistic = {}           # field -> (value, hold_until)
+        self._last_full_poll = 0.0
+        self.track = None               # TrackInfo of the current item
+        self.upcoming = []              # TrackInfo of the next queued items
+        self.liked = LikedCache(
+            lambda ids: self._api('current_user_saved_tracks_contains', ids))
+        self._prefetch_at = 0.0
+        self._prefetching = False
+        self._prefetch_lock = threading.Lock()
+        self._state_lock = threading.Lock()
+        self.clock = PlaybackClock()
+        self.scheduler = PollScheduler(self.clock)
+        self.commands = CommandExecutor({
+            'play': lambda: self._api('start_playback'),
+            'pause': lambda: self._api('pause_playback'),
+            'skip': self._skip,
+            'shuffle': lambda state: self._api('shuffle', state),
+            'repeat': lambda state: self._api('repeat', state),
+            'seek': lambda position_ms: self._api('seek_track', position_ms),
+            'volume': lambda volume: self._api('volume', volume),
+            'set_liked': self.set_liked,
+        }, workers=Config.COMMAND_WORKERS, on_done=self._on_command_done)
         self._init_spotify()
         
     def _init_spotify(self):
         try:
-            self.sp = spotipy.Spotify(auth_manager=SpotifyOAuth(
+            self.tokens = TokenManager(SpotifyOAuth(
                 client_id=CLIENT_ID,
                 client_secret=CLIENT_SECRET,
                 redirect_uri=REDIRECT_URI,
                 scope=SCOPE,
-                cache_path=os.path.join(BASE_DIR, ".spotify_cache")
+                cache_path=os.path.join(BASE_DIR, ".spotify_cache"),
+                requests_session=get_session(),
             ))
+            self.sp = spotipy.Spotify(
+                auth_manager=self.tokens,
+                # Our session mounts no retry adapter, so 429s (with Retry-After)
+                # and 5xx reach the governor instead of sleeping in spotipy
+                requests_session=get_session(),
+            )
+            self.tokens.start()
         except Exception as e:
             self.error.emit(str(e))
             
+    def _api(self, method, *args, **kwargs):
+        """Call a spotipy method through the shared request governor"""
+        return self.governor.call(getattr(self.sp, method), *args, **kwargs)
+        
+    def _background_api(self, method, *args, **kwargs):
+        """Like _api, but only with spare budget and no user command in flight"""
+        if self.commands.pending() or self.scheduler.in_command_window():
+            raise RequestRejected("deferring to user commands", Config.PREFETCH_RETRY)
+        return self.governor.call_background(getattr(self.sp, method), *args, **kwargs)
+        
+    def _fetch_playback(self):
+        """Read playback from the leanest endpoint that answers this poll.
+
+        `market=from_token` drops the per-track/album `available_markets`
+        arrays (most of the payload). Boundary bursts only need the item,
+        progress and play state, so they use `/me/player/currently-playing`;
+        the full `/me/player` (device, shuffle, repeat) is read on the first
+        poll, after commands and every POLL_FULL_EVERY seconds.
+        """
+        now = time.monotonic()
+        full = (
+            self._server_state is None
+            or self.scheduler.in_command_window()
+            or now - self._last_full_poll >= Config.POLL_FULL_EVERY
+        )
+        method = 'current_playback' if full else 'currently_playing'
+        playback = self._api(method, market='from_token', additional_types='episode')
+        if full:
+            self._last_full_poll = now
+        return playback
+            
     def poll(self):
         last_track_id = None
         while self.running:
             if self.sp:
                 try:
-                    playback = self.sp.current_playback()
-                    if playback and playback.get('item'):
-                        self._is_playing = playback.get('is_playing', False)
-                        self.playback_updated.emit(playback)
+                    started = time.monotonic()
+                    playback = self._fetch_playback()
+                    synced_at = (started + time.monotonic()) / 2
+                    state = PlaybackState.from_response(playback, self._server_state)
+                    if state:
+                        with self._state_lock:
+                            self._server_state = state.copy()
+                            self._reconcile(state)
+                            # Only emit what actually changed since the last snapshot
+                            changes = state.diff(self.state)
+                            self.state = state
+                        self._is_playing = state.is_playing
+                        resynced = self.clock.sync(
+                            state.track_id, state.progress_ms, state.duration_ms,
+                            state.is_playing, synced_at,
+                        )
+                        if resynced:
+                            changes['progress_ms'] = state.progress_ms
+                        if changes:
+                            self.playback_updated.emit(changes)
                         
-                        track_id = playback['item']['id']
-                        if track_id != last_track_id:
-                            last_track_id = track_id
-                            self.track_updated.emit(playback)
+                        if state.track_id != last_track_id:
+                            last_track_id = state.track_id
+                            self.track = TrackInfo.from_item(playback['item'])
+                            self.track_updated.emit(self.track)
+                            self._prefetch_at = 0.0     # The queue moved on
+                        if state.is_playing and time.monotonic() >= self._prefetch_at:
+                            self._start_prefetch()
                     else:
                         self._is_playing = False
+                        with self._state_lock:
+                            self.state = self._server_state = None
+                            self._optimistic.clear()
+                        self.clock.reset()
                         if last_track_id:
                             last_track_id = None
-                            self.track_updated.emit({})
+                            self.track = None
+                            self.track_updated.emit(None)
+                except RequestRejected:
+                    pass  # Governor is cooling down - the wait below honors it
                 except Exception as e:
                     if "expired" in str(e).lower():
-                        self._init_spotify()
+                        # Revoked/expired early - swap in a new token, keep the client
+                        try:
+                            self.tokens.refresh()
+                        except Exception as refresh_error:
+                            print(f"Token refresh error: {refresh_error}")
             
-            # Adaptive polling - faster when playing
-            sleep_time = Config.POLL_FAST if self._is_playing else Config.POLL_SLOW
-            time.sleep(sleep_time)
+            # Sparse while playing, bursts around track ends and commands
+            self.scheduler.wait(self._is_playing, min_delay=self.governor.retry_in())
             
     def stop(self):
         self.running = False
+        self.commands.stop()
+        if self.tokens:
+            self.tokens.stop()
+        self.scheduler.wake()
+        
+    def request_refresh(self):
+        """Poll again shortly after a user command"""
+        self.scheduler.note_command()
         
-    def toggle_like(self, track_id):
-        """Toggle like status for a track"""
+    # ──────────────────────────────────────────────────────────
+    # QUEUE PREFETCH
+    # ──────────────────────────────────────────────────────────
+    
+    def _start_prefetch(self):
+        with self._prefetch_lock:
+            if self._prefetching:
+                return
+            self._prefetching = True
+        self._prefetch_at = time.monotonic() + Config.PREFETCH_EVERY
+        threading.Thread(target=self._prefetch, daemon=True).start()
+        
+    def _prefetch(self):
+        """Read the upcoming queue and warm like status for it (background budget).
+
+        The UI warms art and palettes from `upcoming_updated`, so most
+        track changes render entirely from cache.
+        """
         try:
-            is_saved = self.sp.current_user_saved_tracks_contains([track_id])[0]
-            if is_saved:
-                self.sp.current_user_saved_tracks_delete([track_id])
-                return False
-            else:
-                self.sp.current_user_saved_tracks_add([track_id])
-                return True
+            queue = self._background_api('queue') or {}
+            items = [item for item in queue.get('queue') or [] if item]
+            upcoming = [TrackInfo.from_item(item) for item in items[:Config.PREFETCH_DEPTH]]
+            if [t.id for t in upcoming] != [t.id for t in self.upcoming]:
+                self.upcoming = upcoming
+                self.upcoming_updated.emit(upcoming)
+            
+            # Batched with anything else still unknown; if the budget says no,
+            # these ride along with the next interactive lookup instead
+            self.liked.want(t.id for t in upcoming if not t.is_episode)
+            self.liked.flush_wanted(fetch=lambda ids: self._background_api(
+                'current_user_saved_tracks_contains', ids))
+        except RequestRejected:
+            self._prefetch_at = time.monotonic() + Config.PREFETCH_RETRY
         except Exception as e:
-            print(f"Like toggle error: {e}")
-            return None
+            print(f"Prefetch error: {e}")
+        finally:
+            with self._prefetch_lock:
+                self._prefetching = False
+        
+    # ──────────────────────────────────────────────────────────
+    # OPTIMISTIC STATE
+    # ──────────────────────────────────────────────────────────
+    
+    def submit_optimistic(self, kind, *args, **fields):
+        """Queue a command whose PlaybackState `fields` the UI already shows.
+
+        Snapshots that disagree are held back for Config.OPTIMISTIC_HOLD
+        while the command settles; if it fails the fields roll back to the
+        last server values via `playback_updated` (or, before any snapshot,
+        to what was shown before the command).
+        """
+        with self._state_lock:
+            shown = self.state if self.state is not None else PlaybackState()
+            before = {field: getattr(shown, field) for field in fields}
+        self._set_optimistic(fields)
+        self.commands.submit(
+            kind, *args,
+            callback=lambda _: self._set_optimistic(fields),   # hold from completion
+            errback=lambda e: self._rollback(before),
+        )
+        
+    def _set_optimistic(self, fields):
+        until = time.monotonic() + Config.OPTIMISTIC_HOLD
+        with self._state_lock:
+            for field, value in fields.items():
+                self._optimistic[field] = (value, until)
+                if self.state is not None:
+                    setattr(self.state, field, value)
+        if 'is_playing' in fields:
+            self.clock.set_playing(fields['is_playing'])
+            
+    def _reconcile(self, state):
+        """Overlay optimistic values the server hasn't confirmed yet (lock held)"""
+        now = time.monotonic()
+        for field, (value, until) in list(self._optimistic.items()):
+            if getattr(state, field) == value or now >= until:
+                # Confirmed, or the server wins and the diff corrects the UI
+                del self._optimistic[field]
+            else:
+                setattr(state, field, value)
+                
+    def _rollback(self, before):
+        """Revert to the server values, or to `before` if there are none yet"""
+        revert = {}
+        with self._state_lock:
+            for field, value in before.items():
+                self._optimistic.pop(field, None)
+                if self._server_state is not None:
+                    value = getattr(self._server_state, field)
+                revert[field] = value
+                if self.state is not None:
+                    setattr(self.state, field, value)
+        if 'is_playing' in revert:
+            self.clock.set_playing(revert['is_playing'])
+        if revert:
+            self.playback_updated.emit(revert)
+        
+    # ──────────────────────────────────────────────────────────
+    # COMMAND HANDLERS (run on the command executor)
+    # ──────────────────────────────────────────────────────────
+    
+    def _on_command_done(self, kind, error):
+        if kind != 'set_liked':
+            self.request_refresh()
             
+    def _skip(self, count):
+        """Skip by `count` tracks (negative goes back)"""
+        step = 'next_track' if count > 0 else 'previous_track'
+        for _ in range(abs(count)):
+            self._api(step)
+
+    def set_liked(self, track_id, liked):
+        """Save or remove a track - a single write, no contains check"""
+        if liked:
+            self._api('current_user_saved_tracks_add', [track_id])
+        else:
+            self._api('current_user_saved_tracks_delete', [track_id])
+        self.liked.set(track_id, liked)
+        return liked
+        
     def is_liked(self, track_id):
-        """Check if track is liked"""
+        """Check if track is liked (cached, batched with prefetched ids)"""
         try:
-            result = self.sp.current_user_saved_tracks_contains([track_id])
-            return result[0] if result else False
+            return self.liked.lookup([track_id]).get(track_id, False)
         except Exception as e:
             print(f"Check liked error: {e}")
             return False
@@ -0,0 +1,106 @@
+"""
+🔑 Token Manager Module
+━━━━━━━━━━━━━━━━━━━━━━
+Background OAuth refresh so token expiry never stalls polling
+"""
+
+import threading
+import time
+
+from .config import Config
+
+
+class TokenManager:
+    """Keeps the Spotify access token fresh from a background thread.
+
+    Acts as the spotipy `auth_manager`: requests read the current token
+    from memory, and a daemon thread refreshes it TOKEN_REFRESH_MARGIN
+    seconds before `expires_at`, swapping the new token in atomically.
+    Only a token that is already expired (e.g. after sleep) is refreshed
+    on the request path.
+    """
+
+    def __init__(self, oauth):
+        self.oauth = oauth
+        self._token_info = None
+        self._refresh_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._running = False
+        self._thread = None
+        self._stats = {'refreshes': 0, 'failures': 0, 'blocking': 0,
+                       'last_ms': 0.0, 'max_ms': 0.0, 'total_ms': 0.0}
+
+    def start(self):
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="token-refresh", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._running = False
+        self._wake.set()
+
+    # spotipy auth_manager interface
+    def get_access_token(self, as_dict=False, check_cache=True):
+        info = self._token_info
+        if info is None or info['expires_at'] - time.time() < Config.TOKEN_EXPIRY_SLACK:
+            self._stats['blocking'] += 1
+            info = self.refresh(force=False)
+        return info if as_dict else info['access_token']
+
+    def refresh(self, force=True):
+        """Refresh now (or load the cached token) and return the new token info"""
+        with self._refresh_lock:
+            info = self._token_info
+            if not force and info is not None \
+                    and info['expires_at'] - time.time() >= Config.TOKEN_EXPIRY_SLACK:
+                return info  # Another thread already refreshed it
+            started = time.monotonic()
+            try:
+                if info is None:
+                    # First use: cached token, refreshed if needed, or the login flow
+                    new_info = self.oauth.get_access_token(as_dict=True)
+                else:
+                    new_info = self.oauth.refresh_access_token(info['refresh_token'])
+                    new_info.setdefault('refresh_token', info['refresh_token'])
+            except Exception:
+                self._stats['failures'] += 1
+                raise
+            elapsed_ms = (time.monotonic() - started) * 1000
+            self._stats['refreshes'] += 1
+            self._stats['last_ms'] = elapsed_ms
+            self._stats['total_ms'] += elapsed_ms
+            self._stats['max_ms'] = max(self._stats['max_ms'], elapsed_ms)
+            self._token_info = new_info
+        self._wake.set()
+        return new_info
+
+    def expires_in(self):
+        info = self._token_info
+        return None if info is None else info['expires_at'] - time.time()
+
+    def stats(self):
+        s = dict(self._stats)
+        s['avg_ms'] = round(s.pop('total_ms') / (s['refreshes'] or 1), 1)
+        s['expires_in'] = self.expires_in()
+        return s
+
+    def _run(self):
+        while self._running:
+            expires_in = self.expires_in()
+            if expires_in is None:
+                # Nothing loaded yet - the first request will load it
+                delay = Config.TOKEN_RETRY
+            else:
+                delay = expires_in - Config.TOKEN_REFRESH_MARGIN
+            if delay > 0:
+                self._wake.wait(delay)
+                self._wake.clear()
+                continue
+            try:
+                self.refresh()
+            except Exception as e:
+                print(f"Token refresh error: {e}")
+                self._wake.wait(Config.TOKEN_RETRY)
+                self._wake.clear()
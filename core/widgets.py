@@ -4,11 +4,17 @@
 Custom Qt widgets for Dynamic Island UI
 """
 
-from PySide6.QtWidgets import QWidget, QPushButton, QSlider
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QColor, QPainter, QBrush, QPen, QPainterPath, QCursor
+import math
+
+from PySide6.QtWidgets import (
+    QWidget, QPushButton, QSlider, QAbstractSlider, QStyle,
+    QGraphicsScene, QGraphicsBlurEffect
+)
+from PySide6.QtCore import Qt, QEvent, QSize, QRect, QRectF, QPointF
+from PySide6.QtGui import QColor, QPainter, QBrush, QPen, QPainterPath, QCursor, QIcon, QImage, QPixmap
 
 from .config import Colors
+from .lru_cache import LRUCache
 
 # Try to import qtawesome
 try:
@@ -17,37 +23,235 @@ except ImportError:
     qta = None
 
 
+_shadow_cache = LRUCache(16)
+_panel_cache = LRUCache(8, 16 * 1024 * 1024, sizeof=lambda pm: pm.width() * pm.height() * 4)
+
+
+def shadow_tile(radius, blur, color, dpr=1.0):
+    """(pixmap, corner) - a blurred rounded-rect shadow for 9-slice drawing.
+
+    Blurred once per (radius, blur, color, DPR); the middle row and
+    column are a single pixel that stretches to any panel size.
+    """
+    key = (radius, blur, color.rgba(), dpr)
+    cached = _shadow_cache.get(key)
+    if cached is not None:
+        return cached
+    corner = radius + 2 * blur
+    size = 2 * corner + 1
+    px = math.ceil(size * dpr)
+    
+    mask = QPixmap(px, px)
+    mask.fill(Qt.transparent)
+    painter = QPainter(mask)
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.setPen(Qt.NoPen)
+    painter.setBrush(color)
+    inner = (size - 2 * blur) * dpr
+    painter.drawRoundedRect(QRectF(blur * dpr, blur * dpr, inner, inner), radius * dpr, radius * dpr)
+    painter.end()
+    
+    # Same blur QGraphicsDropShadowEffect uses, run once offscreen
+    scene = QGraphicsScene()
+    item = scene.addPixmap(mask)
+    effect = QGraphicsBlurEffect()
+    effect.setBlurRadius(blur * dpr)
+    effect.setBlurHints(QGraphicsBlurEffect.QualityHint)
+    item.setGraphicsEffect(effect)
+    image = QImage(px, px, QImage.Format_ARGB32_Premultiplied)
+    image.fill(Qt.transparent)
+    painter = QPainter(image)
+    scene.render(painter, QRectF(0, 0, px, px), QRectF(0, 0, px, px))
+    painter.end()
+    
+    tile = QPixmap.fromImage(image)
+    tile.setDevicePixelRatio(dpr)
+    _shadow_cache.put(key, (tile, corner))
+    return tile, corner
+
+
+def draw_nine_slice(painter, target, tile, corner):
+    """Draw `tile` into `target`, keeping its corners and stretching the middle.
+
+    When `target` is smaller than two corners, the corners are cropped
+    to their outer parts rather than scaled.
+    """
+    dpr = tile.devicePixelRatio()
+    size = tile.width() / dpr
+    cx = min(corner, target.width() / 2)
+    cy = min(corner, target.height() / 2)
+    columns = ((0, cx, target.left(), cx),
+               (corner, 1, target.left() + cx, target.width() - 2 * cx),
+               (size - cx, cx, target.right() - cx, cx))
+    rows = ((0, cy, target.top(), cy),
+            (corner, 1, target.top() + cy, target.height() - 2 * cy),
+            (size - cy, cy, target.bottom() - cy, cy))
+    for sy, sh, ty, th in rows:
+        for sx, sw, tx, tw in columns:
+            if tw > 0 and th > 0:
+                painter.drawPixmap(QRectF(tx, ty, tw, th), tile,
+                                   QRectF(sx * dpr, sy * dpr, sw * dpr, sh * dpr))
+
+
 class RoundedPanel(QWidget):
-    """Custom widget with rounded corners and shadow"""
+    """Custom widget with rounded corners and shadow.
+
+    The shadow is a cached 9-slice tile and the rounded card a cached
+    pixmap per size, so child repaints never re-run a blur (unlike
+    QGraphicsDropShadowEffect, which re-blurs the whole panel offscreen).
+    The card fills the widget unless `set_card_rect` narrows it, which
+    lets a fixed-size panel animate its visible shape without a relayout.
+    Transient (animation frame) rects are painted directly, so only the
+    resting sizes get cached pixmaps.
+    """
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self.bg_color = QColor(Colors.CARD)
         self.border_color = QColor(Colors.BORDER)
         self.corner_radius = 26
+        self.shadow_color = QColor(0, 0, 0, 100)
+        self.shadow_blur = 20
+        self.shadow_offset = QPointF(0, 4)
+        self._card_rect = None
+        self._transient = False
         self.setAttribute(Qt.WA_TranslucentBackground)
         
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
+    @property
+    def card_rect(self):
+        return QRect(self._card_rect) if self._card_rect is not None else self.rect()
         
-        path = QPainterPath()
-        path.addRoundedRect(0, 0, self.width(), self.height(), 
-                           self.corner_radius, self.corner_radius)
+    def set_card_rect(self, rect, transient=False):
+        """Paint the card at `rect` (None fills the widget)"""
+        rect = QRect(rect) if rect is not None else None
+        if rect != self._card_rect or transient != self._transient:
+            self._card_rect = rect
+            self._transient = transient
+            self.update()
         
+    def set_tint(self, color):
+        """Tint the card background (None restores the default)"""
+        color = QColor(color or Colors.CARD)
+        if color != self.bg_color:
+            self.bg_color = color
+            self.update()
+            
+    def _card(self, dpr):
+        """Rounded background + border for the current card size, rendered once"""
+        rect = self.card_rect
+        w, h = rect.width(), rect.height()
+        key = (w, h, self.corner_radius, dpr, self.bg_color.rgba(), self.border_color.rgba())
+        card = _panel_cache.get(key)
+        if card is None:
+            card = QPixmap(math.ceil(w * dpr), math.ceil(h * dpr))
+            card.setDevicePixelRatio(dpr)
+            card.fill(Qt.transparent)
+            painter = QPainter(card)
+            self._paint_card(painter, QRectF(0, 0, w, h))
+            painter.end()
+            _panel_cache.put(key, card)
+        return card
+        
+    def _paint_card(self, painter, rect):
+        painter.setRenderHint(QPainter.Antialiasing)
+        path = QPainterPath()
+        path.addRoundedRect(rect, self.corner_radius, self.corner_radius)
         painter.fillPath(path, QBrush(self.bg_color))
         painter.setPen(QPen(self.border_color, 1))
         painter.drawPath(path)
+        
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        dpr = self.devicePixelRatioF()
+        
+        tile, corner = shadow_tile(self.corner_radius, self.shadow_blur, self.shadow_color, dpr)
+        pad = self.shadow_blur
+        rect = self.card_rect
+        target = QRectF(rect).translated(self.shadow_offset).adjusted(-pad, -pad, pad, pad)
+        draw_nine_slice(painter, target, tile, corner)
+        
+        if self._transient:
+            self._paint_card(painter, QRectF(rect))
+        else:
+            painter.drawPixmap(rect.topLeft(), self._card(dpr))
+
+
+_icon_cache = LRUCache(256)
+_style_cache = {}
+
+_BUTTON_STYLE = """
+    QPushButton {{
+        background-color: {background};
+        border: none;
+        border-radius: {radius}px;
+        color: {color};
+        font-size: 16px;
+        font-weight: bold;
+    }}
+    QPushButton:hover {{
+        background-color: {hover};
+    }}
+"""
+_PRESSED_STYLE = """
+    QPushButton:pressed {
+        background-color: rgba(255, 255, 255, 0.2);
+    }
+"""
+
+
+def button_icon(icon_name, color, size, dpr=1.0):
+    """qtawesome icon pre-rendered at `size` px, shared by every button.
+
+    qtawesome icons repaint their font glyph on every paint; a pixmap
+    icon is rendered once per (icon, color, size, DPR).
+    """
+    key = (icon_name, color, size, dpr)
+    icon = _icon_cache.get(key)
+    if icon is None:
+        try:
+            source = qta.icon(icon_name, color=color)
+        except Exception:
+            source = qta.icon("fa5s.question", color=color)
+        pixmap = source.pixmap(round(size * dpr), round(size * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        icon = QIcon(pixmap)
+        _icon_cache.put(key, icon)
+    return icon
+
+
+def button_style(active, radius, color):
+    """Stylesheet text for a button state, formatted once per state"""
+    key = (active, radius, color)
+    style = _style_cache.get(key)
+    if style is None:
+        if active:
+            style = _BUTTON_STYLE.format(background="rgba(255, 255, 255, 0.08)", radius=radius,
+                                         color=color, hover="rgba(255, 255, 255, 0.15)")
+        else:
+            style = _BUTTON_STYLE.format(background="transparent", radius=radius,
+                                         color=color, hover="rgba(255, 255, 255, 0.1)") + _PRESSED_STYLE
+        _style_cache[key] = style
+    return style
 
 
 class StyledButton(QPushButton):
-    """Spotify-styled button with hover effects and optional qtawesome icon"""
+    """Spotify-styled button with hover effects and optional qtawesome icon.
+
+    Icons and stylesheets come from shared caches, and every setter is a
+    no-op unless the rendered state actually changes. Icons are rendered
+    for the current device-pixel ratio and re-rendered when the window
+    moves to a screen with another one.
+    """
     
     def __init__(self, icon_name, fallback_text, size=32, parent=None):
         super().__init__(parent)
         self.icon_name = icon_name
         self.fallback_text = fallback_text
         self.icon_color = "white"
+        self._is_active = False
+        self._icon_state = None
+        self._style_state = None
+        self._screen_hooked = False
         self.setFixedSize(size, size)
         self.setCursor(QCursor(Qt.PointingHandCursor))
         self._update_icon()
@@ -55,63 +259,47 @@ class StyledButton(QPushButton):
         
     def _update_icon(self):
         if qta:
-            # Color conversion for qtawesome
-            c = self.icon_color
-            if c == Colors.PRIMARY: c = "#1DB954"
-            elif c == Colors.ACCENT: c = "#2a2a2a"
-            
-            try:
-                self.setIcon(qta.icon("fa5s.circle", color="transparent"))
-                icon = qta.icon(self.icon_name, color=c)
-                self.setIcon(icon)
-                self.setIconSize(self.size() * 0.6)
-                self.setText("")
-            except Exception:
-                self.setIcon(qta.icon("fa5s.question", color=c))
-                self.setText("")
-        else:
+            size = int(self.width() * 0.6)
+            state = (self.icon_name, self.icon_color, size, self.devicePixelRatioF())
+            if state == self._icon_state:
+                return
+            self._icon_state = state
+            self.setIcon(button_icon(*state))
+            self.setIconSize(QSize(size, size))
+            self.setText("")
+        elif self.text() != self.fallback_text:
             self.setText(self.fallback_text)
-        self.update()
-        self.repaint()
             
-    def _update_style(self):
-        self.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                border: none;
-                border-radius: {self.width() // 2}px;
-                color: {self.icon_color};
-                font-size: 16px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background-color: rgba(255, 255, 255, 0.1);
-            }}
-            QPushButton:pressed {{
-                background-color: rgba(255, 255, 255, 0.2);
-            }}
-        """)
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self._screen_hooked:
+            handle = self.window().windowHandle()
+            if handle is not None:
+                handle.screenChanged.connect(self._on_screen_changed)
+                self._screen_hooked = True
+        self._update_icon()     # DPR may differ from when the button was built
+        
+    def _on_screen_changed(self, screen):
+        self._update_icon()
+        
+    def changeEvent(self, event):
+        # Scale change on the same screen (Qt 6.6+)
+        if event.type() == getattr(QEvent.Type, 'DevicePixelRatioChange', None):
+            self._update_icon()
+        super().changeEvent(event)
+        
+    def _update_style(self, active=False):
+        state = (active, self.width() // 2, self.icon_color)
+        if state == self._style_state:
+            return
+        self._style_state = state
+        self.setStyleSheet(button_style(*state))
         
     def set_active(self, active, color=None):
         self._is_active = active
         self.icon_color = (color or Colors.PRIMARY) if active else "white"
-        # Add subtle background when active
-        if active and color:
-            self.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: rgba(255, 255, 255, 0.08);
-                    border: none;
-                    border-radius: {self.width() // 2}px;
-                    color: {self.icon_color};
-                    font-size: 16px;
-                    font-weight: bold;
-                }}
-                QPushButton:hover {{
-                    background-color: rgba(255, 255, 255, 0.15);
-                }}
-            """)
-        else:
-            self._update_style()
+        # Subtle background when active
+        self._update_style(active=bool(active and color))
         self._update_icon()
     
     def set_color(self, color):
@@ -125,38 +313,123 @@ class StyledButton(QPushButton):
         self.icon_name = icon_name
         self.fallback_text = fallback_text
         self._update_icon()
-        self.repaint()
 
 
 class StyledSlider(QSlider):
-    """Spotify-styled slider"""
+    """Spotify-styled slider, painted directly (no stylesheet).
+
+    Draws the same 4px rounded groove, accent sub-page and 12px round
+    handle the old QSS did. Colors are cached QColors, so an accent
+    change is an assignment plus a repaint of the filled part, and
+    value changes repaint only the strip between old and new handle.
+    Mouse input is mapped with the same 12px handle, since the native
+    style's slider length (which QSlider hit-tests with) differs.
+    """
+    
+    GROOVE_H = 4
+    HANDLE = 12
     
     def __init__(self, parent=None):
         super().__init__(Qt.Horizontal, parent)
         self.accent_color = Colors.PRIMARY
-        self._update_style()
+        self._accent = QColor(self.accent_color)
+        self._groove = QColor(Colors.ACCENT)
+        self._painted_x = None
+        self._drag_offset = 0
         self.setCursor(QCursor(Qt.PointingHandCursor))
         
-    def _update_style(self):
-        self.setStyleSheet(f"""
-            QSlider::groove:horizontal {{
-                background: {Colors.ACCENT};
-                height: 4px;
-                border-radius: 2px;
-            }}
-            QSlider::handle:horizontal {{
-                background: {self.accent_color};
-                width: 12px;
-                height: 12px;
-                margin: -4px 0;
-                border-radius: 6px;
-            }}
-            QSlider::sub-page:horizontal {{
-                background: {self.accent_color};
-                border-radius: 2px;
-            }}
-        """)
+    def sizeHint(self):
+        return QSize(super().sizeHint().width(), self.HANDLE + 4)
+        
+    def minimumSizeHint(self):
+        return QSize(self.HANDLE * 2, self.HANDLE + 4)
+        
+    def _handle_x(self):
+        """Left edge of the handle for the current value"""
+        return QStyle.sliderPositionFromValue(
+            self.minimum(), self.maximum(), self.sliderPosition(),
+            max(0, self.width() - self.HANDLE), self.invertedAppearance())
+        
+    def _value_at(self, x):
+        """Value whose handle would start at `x`"""
+        return QStyle.sliderValueFromPosition(
+            self.minimum(), self.maximum(), round(x),
+            max(0, self.width() - self.HANDLE), self.invertedAppearance())
+        
+    def mousePressEvent(self, event):
+        if self.maximum() == self.minimum():
+            event.ignore()
+            return
+        x = event.position().x()
+        handle_x = self._handle_x()
+        button = event.button().value
+        style = self.style()
+        if button & style.styleHint(QStyle.SH_Slider_AbsoluteSetButtons, None, self):
+            # Jump so the handle centers under the cursor, then drag
+            self._drag_offset = self.HANDLE / 2
+            self.setSliderPosition(self._value_at(x - self._drag_offset))
+            self.triggerAction(QAbstractSlider.SliderMove)
+            self.setSliderDown(True)
+        elif button & style.styleHint(QStyle.SH_Slider_PageSetButtons, None, self):
+            if handle_x <= x <= handle_x + self.HANDLE:
+                self._drag_offset = x - handle_x
+                self.setSliderDown(True)
+            else:
+                forward = (x > handle_x) != self.invertedAppearance()
+                action = (QAbstractSlider.SliderPageStepAdd if forward
+                          else QAbstractSlider.SliderPageStepSub)
+                self.triggerAction(action)
+                self.setRepeatAction(action, 500, 50)
+        else:
+            event.ignore()
+            return
+        event.accept()
+        
+    def mouseMoveEvent(self, event):
+        if not self.isSliderDown():
+            event.ignore()
+            return
+        self.setSliderPosition(self._value_at(event.position().x() - self._drag_offset))
+        event.accept()
+        
+    def mouseReleaseEvent(self, event):
+        self.setRepeatAction(QAbstractSlider.SliderNoAction)
+        if self.isSliderDown():
+            self.setSliderDown(False)
+        event.accept()
         
     def set_accent(self, color):
+        if color == self.accent_color:
+            return
         self.accent_color = color
-        self._update_style()
+        self._accent = QColor(color)
+        # Only the sub-page and the handle use the accent
+        self.update(0, 0, self._handle_x() + self.HANDLE + 1, self.height())
+        
+    def sliderChange(self, change):
+        if change == QAbstractSlider.SliderValueChange and self._painted_x is not None:
+            x = self._handle_x()
+            if x == self._painted_x:
+                return
+            lo, hi = sorted((self._painted_x, x))
+            self.update(lo - 1, 0, hi - lo + self.HANDLE + 2, self.height())
+            return
+        super().sliderChange(change)
+        
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        
+        w, h = self.width(), self.height()
+        x = self._handle_x()
+        self._painted_x = x
+        radius = self.GROOVE_H / 2
+        groove_y = (h - self.GROOVE_H) / 2
+        
+        painter.setBrush(self._groove)
+        painter.drawRoundedRect(QRectF(0, groove_y, w, self.GROOVE_H), radius, radius)
+        
+        painter.setBrush(self._accent)
+        painter.drawRoundedRect(QRectF(0, groove_y, x + self.HANDLE / 2, self.GROOVE_H), radius, radius)
+        painter.drawEllipse(QRectF(x, (h - self.HANDLE) / 2, self.HANDLE, self.HANDLE))
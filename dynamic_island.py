@@ -13,33 +13,32 @@ Features:
 
 import sys
 import os
+import math
+import multiprocessing
 import threading
-from io import BytesIO
 
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QLabel, 
     QHBoxLayout, QVBoxLayout,
-    QGraphicsDropShadowEffect, QSystemTrayIcon, QMenu
+    QSystemTrayIcon, QMenu
 )
 from PySide6.QtCore import (
-    Qt, QTimer, QPropertyAnimation, QEasingCurve, 
+    Qt, QTimer, QVariantAnimation, QEasingCurve, 
     Signal, QRect, QSettings
 )
 from PySide6.QtGui import (
     QColor, QPainter, QBrush, QPen,
-    QPixmap, QImage, QPainterPath, QIcon, QAction
+    QPixmap, QPainterPath, QIcon, QAction, QRegion
 )
 
-import requests
-
 # Import from core package
 from core import (
     Colors, Config, BASE_DIR,
-    SpotifyWorker,
+    SpotifyWorker, ImageResult, get_color_index, get_image_pipeline,
     RoundedPanel, StyledButton, StyledSlider,
-    SettingsDialog
+    SettingsDialog, LRUCache, FrameStats, FrameDispatcher
 )
-from core.config import ColorThief, qta
+from core.config import ColorThief
 
 
 # ══════════════════════════════════════════════════════════════
@@ -49,13 +48,15 @@ from core.config import ColorThief, qta
 class DynamicIsland(QMainWindow):
     
     # Signals
-    color_extracted = Signal(str)
-    album_art_loaded = Signal(QImage)
+    image_processed = Signal(object)   # ImageResult from the image pipeline
     like_toggled = Signal()  # New signal for like button update
     
-    # Caches (class-level)
-    _image_cache = {}
-    _color_cache = {}
+    # Caches (class-level, LRU by recency, pixmaps also bounded by memory)
+    _image_cache = LRUCache(Config.CACHE_MAX, Config.PIXMAP_CACHE_BYTES,
+                            sizeof=lambda pm: pm.width() * pm.height() * 4)
+    _color_cache = LRUCache(Config.CACHE_MAX)     # url -> role palette
+    _rounded_cache = LRUCache(Config.CACHE_MAX * 2, Config.ROUNDED_CACHE_BYTES,
+                              sizeof=lambda pm: pm.width() * pm.height() * 4)
     
     def __init__(self):
         super().__init__()
@@ -75,22 +76,29 @@ class DynamicIsland(QMainWindow):
         self.is_expanded = False
         self.current_track_id = None
         self.accent_color = Colors.PRIMARY
+        self._title_color = Colors.TEXT
+        self._mask_rect = None          # Window mask (island + shadow)
         self.current_volume = 50
         self.track_duration = 1
         self._seeking = False
         self._volume_changing = False
         self._current_image_url = None
         self._is_liked = False
+        self._is_playing = False
         self._is_shuffle = False
         self._is_repeat = 'off'
         
+        # Widget updates from signals are merged and applied once per frame
+        self.ui_updates = FrameDispatcher(self)
+        
         # Load settings
         self.mini_mode = self.settings.value("mini_mode", False, type=bool)
         self.button_size = self.settings.value("button_size", 32, type=int)
         
-        # Initial size
-        self._current_w = Config.COLLAPSED_W
-        self._current_h = Config.COLLAPSED_H
+        # The window keeps the expanded size (plus room for the OutBack
+        # overshoot); only the island rect animates
+        self._room_x, self._room_y = self._overshoot_room()
+        self.setFixedSize(Config.EXPANDED_W + 2 * self._room_x, Config.EXPANDED_H + self._room_y)
         self._load_position()
         
         # Build UI
@@ -100,18 +108,29 @@ class DynamicIsland(QMainWindow):
         self._setup_animations()
         
         # Connect signals
-        self.color_extracted.connect(self._set_accent)
-        self.album_art_loaded.connect(self._on_album_art_loaded)
-        self.like_toggled.connect(self._update_like_button)
+        self.image_processed.connect(self._on_image_processed)
+        self.like_toggled.connect(self._on_like_toggled)
+        
+        # Warm the persistent color index off the UI thread
+        threading.Thread(target=get_color_index().load, daemon=True).start()
         
         # Spotify worker
         self.worker = SpotifyWorker()
         self.worker.track_updated.connect(self._on_track_update)
         self.worker.playback_updated.connect(self._on_playback_update)
+        self.worker.upcoming_updated.connect(self._on_upcoming)
         
         self.poll_thread = threading.Thread(target=self.worker.poll, daemon=True)
         self.poll_thread.start()
         
+        # Progress is driven by the local playback clock, once per frame, only
+        # while the bar is on screen and moving
+        self._shown_times = None
+        self.progress_timer = QTimer(self)
+        self.progress_timer.setTimerType(Qt.PreciseTimer)
+        self.progress_timer.setInterval(round(Config.FRAME_BUDGET_MS))
+        self.progress_timer.timeout.connect(self._tick_progress)
+        
         # Mouse tracking
         self.setMouseTracking(True)
         
@@ -124,15 +143,16 @@ class DynamicIsland(QMainWindow):
         pos_y = self.settings.value("pos_y", None)
         
         if pos_x is not None and pos_y is not None:
-            self.setGeometry(int(pos_x), int(pos_y), self._current_w, self._current_h)
+            # Saved as the collapsed island's top-left
+            self.move(int(pos_x) - self._island_rect(False).x(), int(pos_y))
         else:
             screen = QApplication.primaryScreen().geometry()
-            x = (screen.width() - self._current_w) // 2
-            self.setGeometry(x, 10, self._current_w, self._current_h)
+            x = (screen.width() - self.width()) // 2
+            self.move(x, 10)
             
     def _save_position(self):
         """Save window position"""
-        self.settings.setValue("pos_x", self.x())
+        self.settings.setValue("pos_x", self.x() + self._island_rect(False).x())
         self.settings.setValue("pos_y", self.y())
         
     def _setup_tray(self):
@@ -195,63 +215,46 @@ class DynamicIsland(QMainWindow):
         central = QWidget()
         self.setCentralWidget(central)
         
-        # Main panel
+        # Main panel - fills the (expanded-size) window and paints the card
+        # at the animated island rect
         self.panel = RoundedPanel(central)
-        self.panel.setGeometry(0, 0, self._current_w, self._current_h)
+        self.panel.setGeometry(self.rect())
+        
+        # Both states are laid out once at their final size; expand/collapse
+        # only swaps pages, so no animation frame triggers a relayout
+        self.collapsed_page = QWidget(self.panel)
+        self.collapsed_page.setGeometry(self._island_rect(False))
+        self.expanded_page = QWidget(self.panel)
+        self.expanded_page.setGeometry(self._island_rect(True))
+        
+        # ── Collapsed: art, title/artist, volume indicator
+        compact_row = QHBoxLayout(self.collapsed_page)
+        compact_row.setContentsMargins(12, 8, 12, 8)
+        compact_row.setSpacing(10)
+        
+        self.album_art_small = self._make_art_label(Config.ART_SIZE_COLLAPSED)
+        compact_row.addWidget(self.album_art_small)
+        self.title_label_small, self.artist_label_small = self._make_info(compact_row, 100)
+        compact_row.addStretch()
         
-        # Shadow effect
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(20)
-        shadow.setColor(QColor(0, 0, 0, 100))
-        shadow.setOffset(0, 4)
-        self.panel.setGraphicsEffect(shadow)
+        self.vol_indicator = QLabel("🔊")
+        self.vol_indicator.setStyleSheet(f"color: {Colors.TEXT_DIM}; font-size: 12px;")
+        compact_row.addWidget(self.vol_indicator)
         
-        # Layout
-        self.layout = QVBoxLayout(self.panel)
+        # ── Expanded: art, title/artist, controls, seek bar, volume
+        self.layout = QVBoxLayout(self.expanded_page)
         self.layout.setContentsMargins(12, 8, 12, 8)
         self.layout.setSpacing(6)
         
-        # Top row (always visible)
+        # Top row
         top_row = QHBoxLayout()
         top_row.setSpacing(10)
         
-        # Album art
-        self.album_art = QLabel()
-        self.album_art.setFixedSize(36, 36)
-        self.album_art.setStyleSheet(f"""
-            background-color: {Colors.ACCENT};
-            border-radius: 8px;
-            color: white;
-            font-size: 16px;
-        """)
-        self.album_art.setAlignment(Qt.AlignCenter)
-        self.album_art.setText("♪")
-        self.album_art.mousePressEvent = lambda e: self._open_spotify()
+        self.album_art = self._make_art_label(Config.ART_SIZE_EXPANDED)
         top_row.addWidget(self.album_art)
-        
-        # Info
-        info_layout = QVBoxLayout()
-        info_layout.setSpacing(2)
-        
-        self.title_label = QLabel("Not Playing")
-        self.title_label.setStyleSheet(f"color: {Colors.TEXT}; font-size: 13px; font-weight: bold;")
-        self.title_label.setMaximumWidth(100)
-        
-        self.artist_label = QLabel("Open Spotify")
-        self.artist_label.setStyleSheet(f"color: {Colors.TEXT_DIM}; font-size: 11px;")
-        self.artist_label.setMaximumWidth(100)
-        
-        info_layout.addWidget(self.title_label)
-        info_layout.addWidget(self.artist_label)
-        top_row.addLayout(info_layout)
-        
+        self.title_label, self.artist_label = self._make_info(top_row, 200)
         top_row.addStretch()
         
-        # Volume indicator (collapsed)
-        self.vol_indicator = QLabel("🔊")
-        self.vol_indicator.setStyleSheet(f"color: {Colors.TEXT_DIM}; font-size: 12px;")
-        top_row.addWidget(self.vol_indicator)
-        
         # Control buttons (expanded)
         self.controls = QWidget()
         controls_layout = QHBoxLayout(self.controls)
@@ -284,7 +287,6 @@ class DynamicIsland(QMainWindow):
         controls_layout.addWidget(self.btn_repeat)
         controls_layout.addWidget(self.btn_close)
         
-        self.controls.hide()
         top_row.addWidget(self.controls)
         
         self.layout.addLayout(top_row)
@@ -310,7 +312,6 @@ class DynamicIsland(QMainWindow):
         seek_layout.addWidget(self.seek_slider)
         seek_layout.addWidget(self.time_total)
         
-        self.seek_row.hide()
         self.layout.addWidget(self.seek_row)
         
         # Volume slider (expanded)
@@ -318,13 +319,104 @@ class DynamicIsland(QMainWindow):
         self.vol_slider.setRange(0, 100)
         self.vol_slider.setValue(50)
         self.vol_slider.valueChanged.connect(self._on_volume_change)
-        self.vol_slider.hide()
         self.layout.addWidget(self.vol_slider)
         
+        self.expanded_page.hide()
+        self._set_island_rect(self._island_rect(False))
+        
+    def _make_art_label(self, size):
+        label = QLabel()
+        label.setFixedSize(size, size)
+        label.setStyleSheet(f"""
+            background-color: {Colors.ACCENT};
+            border-radius: 8px;
+            color: white;
+            font-size: 16px;
+        """)
+        label.setAlignment(Qt.AlignCenter)
+        label.setText("♪")
+        label.mousePressEvent = lambda e: self._open_spotify()
+        return label
+        
+    def _make_info(self, row, max_width):
+        """Title/artist column added to `row`"""
+        info_layout = QVBoxLayout()
+        info_layout.setSpacing(2)
+        
+        title = QLabel("Not Playing")
+        title.setStyleSheet(f"color: {Colors.TEXT}; font-size: 13px; font-weight: bold;")
+        title.setMaximumWidth(max_width)
+        
+        artist = QLabel("Open Spotify")
+        artist.setStyleSheet(f"color: {Colors.TEXT_DIM}; font-size: 11px;")
+        artist.setMaximumWidth(max_width)
+        
+        info_layout.addWidget(title)
+        info_layout.addWidget(artist)
+        row.addLayout(info_layout)
+        return title, artist
+        
     def _setup_animations(self):
-        self.size_anim = QPropertyAnimation(self, b"geometry")
+        # Animates the island rect: the card only, content stays put
+        self.size_anim = QVariantAnimation(self)
         self.size_anim.setEasingCurve(QEasingCurve.OutBack)
         self.size_anim.setDuration(Config.ANIMATION_MS)
+        self.size_anim.valueChanged.connect(self._on_size_anim_frame)
+        
+        # Frame timing, printed after each animation with Config.FRAME_STATS
+        self._frame_stats = FrameStats()
+        self.size_anim.finished.connect(self._on_size_anim_finished)
+        
+    @staticmethod
+    def _overshoot_room():
+        """(x per side, y) px the OutBack expand grows past the expanded size"""
+        curve = QEasingCurve(QEasingCurve.OutBack)
+        peak = max(curve.valueForProgress(i / 1000) for i in range(1001)) - 1
+        return (math.ceil(peak * (Config.EXPANDED_W - Config.COLLAPSED_W) / 2),
+                math.ceil(peak * (Config.EXPANDED_H - Config.COLLAPSED_H)))
+        
+    def _island_rect(self, expanded):
+        """Where the island rests inside the (always expanded-size) window"""
+        if expanded:
+            return QRect(self._room_x, 0, Config.EXPANDED_W, Config.EXPANDED_H)
+        return QRect(self._room_x + (Config.EXPANDED_W - Config.COLLAPSED_W) // 2, 0,
+                     Config.COLLAPSED_W, Config.COLLAPSED_H)
+        
+    def _set_island_rect(self, rect, transient=False):
+        rect = rect.intersected(self.panel.rect())
+        self.panel.set_card_rect(rect, transient)
+        if not transient:
+            self._set_mask_rect(rect)
+            
+    def _set_mask_rect(self, rect):
+        """Clip the window to `rect` and its shadow (a native region update,
+        so only at rest and once per animation - never per frame)"""
+        pad = self.panel.shadow_blur
+        shadow = rect.translated(self.panel.shadow_offset.toPoint()).adjusted(-pad, -pad, pad, pad)
+        mask = rect.united(shadow).intersected(self.rect())
+        if mask != self._mask_rect:
+            self._mask_rect = mask
+            self.setMask(QRegion(mask))
+        
+    def _on_size_anim_frame(self, rect):
+        self._set_island_rect(rect, transient=True)
+        self._frame_stats.tick()
+        
+    def _on_size_anim_finished(self):
+        # Resting size - the panel goes back to its cached card
+        self._set_island_rect(self._island_rect(self.is_expanded))
+        if Config.FRAME_STATS:
+            print(self._frame_stats.format("expand" if self.is_expanded else "collapse"))
+            
+    def _animate_island(self, expanded):
+        self.size_anim.stop()
+        start, end = self.panel.card_rect, self._island_rect(expanded)
+        # Cover every frame (overshoot included) up front
+        self._set_mask_rect(start.united(end).adjusted(-self._room_x, 0, self._room_x, self._room_y))
+        self.size_anim.setStartValue(start)
+        self.size_anim.setEndValue(end)
+        self._frame_stats.start()
+        self.size_anim.start()
         
     def enterEvent(self, event):
         self._expand()
@@ -337,56 +429,29 @@ class DynamicIsland(QMainWindow):
             return
         self.is_expanded = True
         
-        self.vol_indicator.hide()
-        self.controls.show()
-        self.seek_row.show()
-        self.vol_slider.show()
-        self.album_art.setFixedSize(48, 48)
-        self.title_label.setMaximumWidth(200)
-        self.artist_label.setMaximumWidth(200)
-        
-        QTimer.singleShot(10, self._apply_album_art)
-        
-        current_x = self.x()
-        current_y = self.y()
-        new_x = current_x - (Config.EXPANDED_W - self._current_w) // 2
-        
-        self.size_anim.setStartValue(self.geometry())
-        self.size_anim.setEndValue(QRect(new_x, current_y, Config.EXPANDED_W, Config.EXPANDED_H))
-        self.size_anim.start()
-        
-        self._current_w = Config.EXPANDED_W
-        self._current_h = Config.EXPANDED_H
+        self.collapsed_page.hide()
+        self.expanded_page.show()
+        self._tick_progress()
+        self._sync_progress_timer()
+        self._animate_island(True)
         
     def _collapse(self):
         if not self.is_expanded:
             return
         self.is_expanded = False
         
-        self.controls.hide()
-        self.seek_row.hide()
-        self.vol_slider.hide()
-        self.vol_indicator.show()
-        self.album_art.setFixedSize(36, 36)
-        self.title_label.setMaximumWidth(100)
-        self.artist_label.setMaximumWidth(100)
+        self.expanded_page.hide()
+        self.collapsed_page.show()
+        self._sync_progress_timer()
+        self._animate_island(False)
         
-        QTimer.singleShot(10, self._apply_album_art)
-        
-        current_x = self.x()
-        current_y = self.y()
-        new_x = current_x + (self._current_w - Config.COLLAPSED_W) // 2
-        
-        self.size_anim.setStartValue(self.geometry())
-        self.size_anim.setEndValue(QRect(new_x, current_y, Config.COLLAPSED_W, Config.COLLAPSED_H))
-        self.size_anim.start()
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._sync_progress_timer()
         
-        self._current_w = Config.COLLAPSED_W
-        self._current_h = Config.COLLAPSED_H
-        
-    def resizeEvent(self, event):
-        self.panel.setGeometry(0, 0, self.width(), self.height())
-        super().resizeEvent(event)
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self._sync_progress_timer()
         
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
@@ -401,53 +466,82 @@ class DynamicIsland(QMainWindow):
             del self._drag_pos
             self._save_position()
         
-    def _on_track_update(self, data):
-        if not data:
-            self.title_label.setText("Not Playing")
-            self.artist_label.setText("Open Spotify")
-            self.btn_play.set_icon_state("fa5s.play", "▶")
-            self.album_art.setText("♪")
-            self.album_art.setPixmap(QPixmap())
-            self._set_accent(Colors.PRIMARY)
+    def _on_track_update(self, track):
+        post = self.ui_updates.post
+        if not track:
+            post('text', self._set_track_text, "Not Playing", "Open Spotify")
+            self._is_playing = False
+            self._sync_progress_timer()
+            post('play', self._update_play_button, False)
+            post('art', self._clear_album_art)
+            post('palette', self._apply_palette, None)
             self.current_track_id = None
             return
             
-        track = data['item']
-        self.current_track_id = track['id']
-        track_name = track['name'][:25] + "..." if len(track['name']) > 25 else track['name']
-        self.title_label.setText(track_name)
-        self.artist_label.setText(track['artists'][0]['name'][:20])
-        
-        # Check if track is liked
-        threading.Thread(target=self._check_liked, daemon=True).start()
-        
-        # Load album art
-        images = track['album'].get('images', [])
-        if images:
-            small_img = images[-1] if len(images) > 1 else images[0]
-            img_url = small_img['url']
-            
+        self.current_track_id = track.id
+        track_name = track.name[:25] + "..." if len(track.name) > 25 else track.name
+        post('text', self._set_track_text, track_name, track.artist[:20])
+        
+        # Check if track is liked (episodes can't be saved as tracks)
+        if track.is_episode:
+            self._is_liked = False
+            post('like', self._update_like_button)
+        else:
+            cached = self.worker.liked.get(track.id)
+            if cached is not None:
+                self._is_liked = cached
+                post('like', self._update_like_button)
+            else:
+                threading.Thread(target=self._check_liked, args=(track.id,), daemon=True).start()
+        
+        # Load album art - the variant that covers the expanded label in device pixels
+        img_url = track.art_url(self._art_device_px())
+        if img_url:
             if img_url == self._current_image_url:
                 return
             self._current_image_url = img_url
             
-            if img_url in DynamicIsland._image_cache:
-                self._original_album_pixmap = DynamicIsland._image_cache[img_url]
-                QTimer.singleShot(0, self._apply_album_art)
-                if img_url in DynamicIsland._color_cache:
-                    cached_color = DynamicIsland._color_cache[img_url]
-                    QTimer.singleShot(0, lambda c=cached_color: self._set_accent(c))
-                else:
-                    threading.Thread(target=self._extract_color_only, args=(img_url,), daemon=True).start()
-            else:
-                threading.Thread(target=self._load_album_art, args=(img_url,), daemon=True).start()
+            # Palettes are stored per album, so every art size shares one entry
+            color_key = track.album_id or img_url
+            cached_palette = (DynamicIsland._color_cache.get(img_url)
+                              or get_color_index().get_palette(color_key))
+            if cached_palette:
+                post('palette', self._apply_palette, cached_palette)
+            
+            cached_pixmap = DynamicIsland._image_cache.get(img_url)
+            if cached_pixmap is not None:
+                post('art', self._set_album_pixmap, img_url, cached_pixmap)
+            if cached_pixmap is None or not cached_palette:
+                # One fetch/decode serves both the pixmap and the palette
+                self._request_art(img_url, color_key)
+                
+    def _set_track_text(self, title, artist):
+        for title_label, artist_label in ((self.title_label_small, self.artist_label_small),
+                                          (self.title_label, self.artist_label)):
+            title_label.setText(title)
+            artist_label.setText(artist)
+            
+    def _on_upcoming(self, tracks):
+        """Warm art, palettes and rounded pixmaps for the next queued tracks"""
+        px = self._art_device_px()
+        for track in tracks:
+            url = track.art_url(px)
+            if not url or url == self._current_image_url:
+                continue
+            if url not in DynamicIsland._image_cache or url not in DynamicIsland._color_cache:
+                self._request_art(url, track.album_id or url)
                 
-    def _check_liked(self):
-        """Check if current track is liked"""
-        if self.current_track_id:
-            self._is_liked = self.worker.is_liked(self.current_track_id)
-            QTimer.singleShot(0, self._update_like_button)
+    def _check_liked(self, track_id):
+        """Check if a track is liked (Worker Thread)"""
+        liked = self.worker.is_liked(track_id)
+        if track_id == self.current_track_id:
+            self._is_liked = liked
+            self.like_toggled.emit()
             
+    def _on_like_toggled(self):
+        """Emitted from worker threads - a bound slot so it is queued to the UI thread"""
+        self.ui_updates.post('like', self._update_like_button)
+        
     def _update_like_button(self):
         if self._is_liked:
             # Solid filled heart when liked
@@ -458,25 +552,58 @@ class DynamicIsland(QMainWindow):
             self.btn_like.set_icon_state("mdi.heart-outline", "♡")
             self.btn_like.set_color(self.accent_color)
             
-    def _on_playback_update(self, data):
-        if not data:
+    def _on_playback_update(self, changes):
+        """Apply PlaybackState deltas - only touch widgets whose fields changed"""
+        if not changes:
             return
+        post = self.ui_updates.post
+            
+        if 'is_playing' in changes:
+            self._is_playing = changes['is_playing']
+            post('play', self._update_play_button, self._is_playing)
+            self._sync_progress_timer()
+            
+        # Shuffle state - use accent color
+        if 'shuffle' in changes:
+            self._is_shuffle = changes['shuffle']
+            post('shuffle', self._update_shuffle_button)
+            
+        # Repeat state - use accent color
+        if 'repeat' in changes:
+            self._is_repeat = changes['repeat']
+            post('repeat', self._update_repeat_button)
             
-        is_playing = data.get('is_playing', False)
+        # Volume
+        if 'volume' in changes:
+            self.current_volume = changes['volume']
+            if not self._volume_changing:
+                post('volume', self._show_volume, changes['volume'])
+                
+        # Progress (between polls the clock timer moves the bar)
+        if 'duration_ms' in changes:
+            self.track_duration = changes['duration_ms'] or 1
+        if 'duration_ms' in changes or 'progress_ms' in changes:
+            post('progress', self._tick_progress)
+            
+    def _show_volume(self, vol):
+        self.vol_slider.blockSignals(True)
+        self.vol_slider.setValue(vol)
+        self.vol_slider.blockSignals(False)
+        self._update_vol_icon(vol)
+        
+    def _update_play_button(self, is_playing):
         if is_playing:
             self.btn_play.set_icon_state("fa5s.pause", "❚❚")
         else:
             self.btn_play.set_icon_state("fa5s.play", "▶")
-        
-        # Shuffle state - use accent color
-        self._is_shuffle = data.get('shuffle_state', False)
+            
+    def _update_shuffle_button(self):
         if self._is_shuffle:
             self.btn_shuffle.set_active(True, self.accent_color)
         else:
             self.btn_shuffle.set_color(self.accent_color)  # Use accent color even when inactive
-        
-        # Repeat state - use accent color
-        self._is_repeat = data.get('repeat_state', 'off')
+            
+    def _update_repeat_button(self):
         if self._is_repeat == 'context':
             # Context repeat (All) - infinity symbol
             self.btn_repeat.set_icon_state("fa5s.redo", "∞")
@@ -489,152 +616,148 @@ class DynamicIsland(QMainWindow):
             # Repeat off
             self.btn_repeat.set_icon_state("fa5s.redo", "↻")
             self.btn_repeat.set_color(self.accent_color)  # Use accent color even when inactive
-            
-        # Volume
-        device = data.get('device', {})
-        vol = device.get('volume_percent', 50)
-        self.current_volume = vol
-        if not self._volume_changing:
-            self.vol_slider.blockSignals(True)
-            self.vol_slider.setValue(vol)
-            self.vol_slider.blockSignals(False)
-            self._update_vol_icon(vol)
-            
-        # Progress
-        item = data.get('item', {})
-        duration = item.get('duration_ms', 1)
-        progress = data.get('progress_ms', 0)
-        self.track_duration = duration
-        
-        if not self._seeking:
-            pct = int((progress / duration) * 100) if duration > 0 else 0
-            self.seek_slider.blockSignals(True)
-            self.seek_slider.setValue(pct)
-            self.seek_slider.blockSignals(False)
+        
+    def _sync_progress_timer(self):
+        """Run the frame timer only while the bar is visible and moving"""
+        active = self.is_expanded and self.isVisible() and self._is_playing
+        if active != self.progress_timer.isActive():
+            if active:
+                self.progress_timer.start()
+            else:
+                self.progress_timer.stop()
+                
+    def _tick_progress(self):
+        """Move the seek bar from the local playback clock (millisecond resolution)"""
+        if self._seeking:
+            return
+        clock = self.worker.clock
+        duration = max(clock.duration_ms, 1)
+        progress = max(0, min(clock.position_ms(), duration))
+        slider = self.seek_slider
+        slider.blockSignals(True)
+        if slider.maximum() != duration:
+            slider.setRange(0, duration)
+            slider.setPageStep(max(1, duration // 10))
+            slider.setSingleStep(5000)
+        slider.setValue(progress)    # Repaints only if the handle moved a pixel
+        slider.blockSignals(False)
+        
+        # Labels change once a second, not once a frame
+        shown = (progress // 1000, duration // 1000)
+        if shown != self._shown_times:
+            self._shown_times = shown
             self._update_times(progress, duration)
             
-    def _load_album_art(self, url):
+    def _request_art(self, url, color_key):
+        """Run the image pipeline for `url`; results come back on the UI thread"""
+        future = get_image_pipeline().submit(url, color_key)
+        future.add_done_callback(lambda f: self._on_pipeline_done(url, color_key, f))
+        
+    def _on_pipeline_done(self, url, color_key, future):
+        """Pipeline thread - hand the result over to the UI thread"""
         try:
-            response = requests.get(url, timeout=10)
-            img_data = response.content
-            
-            if ColorThief:
-                try:
-                    thief = ColorThief(BytesIO(img_data))
-                    # Get dominant color directly
-                    r, g, b = thief.get_color(quality=1)
-                    
-                    # Ensure color is not too dark (since bg is dark)
-                    brightness = (r + g + b) / 3
-                    if brightness < 60:
-                        # Brighten the color
-                        factor = 1.5
-                        r = min(255, int(r * factor))
-                        g = min(255, int(g * factor))
-                        b = min(255, int(b * factor))
-                        
-                        # If still too dark, fallback to primary or boost more
-                        if (r + g + b) / 3 < 60:
-                            # Use a lighter version of the color
-                            r, g, b = [min(255, c + 60) for c in (r, g, b)]
-                    
-                    color = f"#{r:02x}{g:02x}{b:02x}"
-                    
-                    # Cache with limit
-                    DynamicIsland._color_cache[url] = color
-                    if len(DynamicIsland._color_cache) > Config.CACHE_MAX:
-                        oldest = next(iter(DynamicIsland._color_cache))
-                        del DynamicIsland._color_cache[oldest]
-                        
-                    self.color_extracted.emit(color)
-                except Exception as e:
-                    print(f"Color extraction error: {e}")
-                    self.color_extracted.emit(Colors.PRIMARY)
-            else:
-                print("ColorThief not installed, using default color")
-                self.color_extracted.emit(Colors.PRIMARY)
-                
-            from PySide6.QtCore import QByteArray
-            byte_array = QByteArray(img_data)
-            qimg = QImage()
-            if qimg.loadFromData(byte_array):
-                self.album_art_loaded.emit(qimg)
+            result = future.result()
         except Exception as e:
             print(f"Image load error: {e}")
+            result = ImageResult(url, color_key, None, None)    # Reset to defaults
+        self.image_processed.emit(result)
             
-    def _on_album_art_loaded(self, image):
-        """Handle loaded album art image (Main Thread)"""
-        pixmap = QPixmap.fromImage(image)
-        self._original_album_pixmap = pixmap
-        
-        # Re-implement cache logic properly:
-        if self._current_image_url:
-            DynamicIsland._image_cache[self._current_image_url] = pixmap
-            if len(DynamicIsland._image_cache) > Config.CACHE_MAX:
-                oldest = next(iter(DynamicIsland._image_cache))
-                del DynamicIsland._image_cache[oldest]
+    def _on_image_processed(self, result):
+        """Cache a pipeline result and apply it if it is still current (Main Thread)"""
+        is_current = result.url == self._current_image_url
+        
+        if result.palette:
+            DynamicIsland._color_cache.put(result.url, result.palette)
+        if is_current:
+            self.ui_updates.post('palette', self._apply_palette,
+                                 result.palette or (result.color and {'accent': result.color}))
             
-        self._apply_album_art()
-            
-    def _extract_color_only(self, url):
-        try:
-            if ColorThief:
-                response = requests.get(url, timeout=10)
-                thief = ColorThief(BytesIO(response.content))
-                # Get dominant color directly
-                r, g, b = thief.get_color(quality=1)
-                
-                # Ensure color is not too dark
-                brightness = (r + g + b) / 3
-                if brightness < 60:
-                    factor = 1.5
-                    r = min(255, int(r * factor))
-                    g = min(255, int(g * factor))
-                    b = min(255, int(b * factor))
-                    
-                    if (r + g + b) / 3 < 60:
-                         r, g, b = [min(255, c + 60) for c in (r, g, b)]
-                
-                color = f"#{r:02x}{g:02x}{b:02x}"
-                DynamicIsland._color_cache[url] = color
-                self.color_extracted.emit(color)
-            else:
-                self.color_extracted.emit(Colors.PRIMARY)
-        except Exception as e:
-            print(f"Color extract only error: {e}")
-            self.color_extracted.emit(Colors.PRIMARY)
+        if result.image is not None and result.url not in DynamicIsland._image_cache:
+            pixmap = QPixmap.fromImage(result.image)
+            DynamicIsland._image_cache.put(result.url, pixmap)
+            self._prerender_art(result.url, pixmap)
+            if is_current:
+                self.ui_updates.post('art', self._set_album_pixmap, result.url, pixmap)
+        elif result.image is None and is_current and result.url not in DynamicIsland._image_cache:
+            # Nothing to show - don't leave the previous track's art up
+            self.ui_updates.post('art', self._clear_album_art)
             
-    def _create_rounded_pixmap(self, pixmap, size, radius):
-        scaled = pixmap.scaled(size, size, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
+    def _art_device_px(self):
+        return math.ceil(Config.ART_SIZE_EXPANDED * self.devicePixelRatioF())
         
-        if scaled.width() != size or scaled.height() != size:
-            x = (scaled.width() - size) // 2
-            y = (scaled.height() - size) // 2
-            scaled = scaled.copy(x, y, size, size)
+    def _create_rounded_pixmap(self, pixmap, size, radius, dpr=1.0):
+        device = round(size * dpr)
+        scaled = pixmap.scaled(device, device, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
         
-        rounded = QPixmap(size, size)
+        if scaled.width() != device or scaled.height() != device:
+            x = (scaled.width() - device) // 2
+            y = (scaled.height() - device) // 2
+            scaled = scaled.copy(x, y, device, device)
+        
+        rounded = QPixmap(device, device)
         rounded.fill(Qt.transparent)
         
         painter = QPainter(rounded)
         painter.setRenderHint(QPainter.Antialiasing)
         
         path = QPainterPath()
-        path.addRoundedRect(0, 0, size, size, radius, radius)
+        path.addRoundedRect(0, 0, device, device, radius * dpr, radius * dpr)
         painter.setClipPath(path)
         painter.drawPixmap(0, 0, scaled)
         painter.end()
         
+        rounded.setDevicePixelRatio(dpr)
+        return rounded
+        
+    def _rounded_art(self, url, pixmap, size):
+        """Rounded pixmap for the label at `size`, rendered once per (image, size, DPR, radius)"""
+        dpr = self.album_art.devicePixelRatioF()
+        key = (url, size, dpr, Config.ART_RADIUS)
+        rounded = DynamicIsland._rounded_cache.get(key)
+        if rounded is None:
+            rounded = self._create_rounded_pixmap(pixmap, size, Config.ART_RADIUS, dpr)
+            DynamicIsland._rounded_cache.put(key, rounded)
         return rounded
+        
+    def _prerender_art(self, url, pixmap):
+        """Render both label sizes up front so hovering does no image work"""
+        for size in (Config.ART_SIZE_COLLAPSED, Config.ART_SIZE_EXPANDED):
+            self._rounded_art(url, pixmap, size)
+            
+    def _set_album_pixmap(self, url, pixmap):
+        """Show new art if it is still the current track's"""
+        if url != self._current_image_url:
+            return
+        self._original_album_pixmap = pixmap
+        self._album_pixmap_url = url
+        self._prerender_art(url, pixmap)
+        self._apply_album_art()
+            
+    def _clear_album_art(self):
+        for label in (self.album_art_small, self.album_art):
+            label.setText("♪")
+            label.setPixmap(QPixmap())
             
     def _apply_album_art(self):
         pixmap = getattr(self, '_original_album_pixmap', None)
         if pixmap and not pixmap.isNull():
-            size = self.album_art.width()
-            rounded = self._create_rounded_pixmap(pixmap, size, 8)
-            self.album_art.setPixmap(rounded)
-            self.album_art.setText("")
-            self.album_art.setScaledContents(False)
+            # Both sizes are pre-rendered - this only swaps cached pixmaps
+            for label in (self.album_art_small, self.album_art):
+                label.setPixmap(self._rounded_art(self._album_pixmap_url, pixmap, label.width()))
+                label.setText("")
+                label.setScaledContents(False)
 
+    def _apply_palette(self, palette):
+        """Theme the island from a precomputed role palette (None = defaults)"""
+        palette = palette or {}
+        self.panel.set_tint(palette.get('tint'))
+        text = palette.get('text', Colors.TEXT)
+        if text != self._title_color:
+            self._title_color = text
+            for label in (self.title_label_small, self.title_label):
+                label.setStyleSheet(f"color: {text}; font-size: 13px; font-weight: bold;")
+        self._set_accent(palette.get('accent', Colors.PRIMARY))
+        
     def _set_accent(self, color):
         self.accent_color = color
         
@@ -704,63 +827,52 @@ class DynamicIsland(QMainWindow):
     # ──────────────────────────────────────────────────────────
     
     def _toggle_play(self):
-        def action():
-            try:
-                state = self.worker.sp.current_playback()
-                if state and state.get('is_playing'):
-                    self.worker.sp.pause_playback()
-                else:
-                    self.worker.sp.start_playback()
-            except: pass
-        threading.Thread(target=action, daemon=True).start()
+        # Act on the state we already show - no round-trip to read it first
+        playing = not self._is_playing
+        self._on_playback_update({'is_playing': playing})
+        self.worker.submit_optimistic('play' if playing else 'pause', is_playing=playing)
         
     def _next_track(self):
-        threading.Thread(target=lambda: self.worker.sp.next_track(), daemon=True).start()
+        self.worker.commands.submit('skip', 1)
         
     def _prev_track(self):
-        threading.Thread(target=lambda: self.worker.sp.previous_track(), daemon=True).start()
+        self.worker.commands.submit('skip', -1)
         
     def _toggle_shuffle(self):
-        def action():
-            try:
-                new_state = not self._is_shuffle
-                self.worker.sp.shuffle(new_state)
-            except Exception as e:
-                # Handle 403 errors (Premium required, podcasts, etc.)
-                # Silently ignore restriction violations
-                pass
-        threading.Thread(target=action, daemon=True).start()
+        shuffle = not self._is_shuffle
+        self._on_playback_update({'shuffle': shuffle})
+        self.worker.submit_optimistic('shuffle', shuffle, shuffle=shuffle)
         
     def _toggle_like(self):
-        def action():
-            if self.current_track_id:
-                result = self.worker.toggle_like(self.current_track_id)
-                if result is not None:
-                    self._is_liked = result
-                    self.like_toggled.emit()
-        threading.Thread(target=action, daemon=True).start()
+        track_id = self.current_track_id
+        if not track_id:
+            return
+        liked = not self._is_liked
+        self._is_liked = liked
+        self.ui_updates.post('like', self._update_like_button)
+        
+        def failed(error):
+            print(f"Like toggle error: {error}")
+            if self.current_track_id == track_id:
+                self._is_liked = not liked
+                self.like_toggled.emit()
+        self.worker.commands.submit('set_liked', track_id, liked, errback=failed)
         
     def _toggle_repeat(self):
-        def action():
-            try:
-                state = self.worker.sp.current_playback()
-                if not state: return
-                current = state.get('repeat_state', 'off')
-                new = {'off': 'context', 'context': 'track', 'track': 'off'}[current]
-                self.worker.sp.repeat(new)
-            except: pass
-        threading.Thread(target=action, daemon=True).start()
+        repeat = {'off': 'context', 'context': 'track', 'track': 'off'}[self._is_repeat]
+        self._on_playback_update({'repeat': repeat})
+        self.worker.submit_optimistic('repeat', repeat, repeat=repeat)
         
     def _on_seek_release(self):
         self._seeking = False
-        val = self.seek_slider.value()
-        pos_ms = int((val / 100) * self.track_duration)
-        threading.Thread(target=lambda: self.worker.sp.seek_track(pos_ms), daemon=True).start()
+        pos_ms = self.seek_slider.value()
+        self.worker.clock.seek(pos_ms)
+        self.worker.commands.submit('seek', pos_ms)
         
     def _on_volume_change(self, val):
         self._volume_changing = True
         self.current_volume = val
-        self._update_vol_icon(val)
+        self.ui_updates.post('volume', self._show_volume, val)
         
         if hasattr(self, '_vol_timer'):
             self._vol_timer.stop()
@@ -771,7 +883,7 @@ class DynamicIsland(QMainWindow):
         
     def _set_volume(self, vol):
         self._volume_changing = False
-        threading.Thread(target=lambda: self.worker.sp.volume(vol), daemon=True).start()
+        self.worker.commands.submit('volume', vol)
         
     def _open_spotify(self):
         if sys.platform == 'win32':
@@ -798,6 +910,8 @@ class DynamicIsland(QMainWindow):
 # ══════════════════════════════════════════════════════════════
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()    # Analysis pool workers in the frozen exe
+    
     if not ColorThief:
         print("⚠️  Install colorthief for dynamic colors: pip install colorthief")
         